@@ -52,4 +52,8 @@ function(define_foam_compile_flags MODULE_NAME)
     message(STATUS "")
     message(STATUS "==================================================================================")
 
+    # a function has its own scope, export the flags to the caller
+    set(CMAKE_CXX_FLAGS "${CMAKE_CXX_FLAGS}" PARENT_SCOPE)
+    set(CMAKE_CXX_FLAGS_RELEASE "${CMAKE_CXX_FLAGS_RELEASE}" PARENT_SCOPE)
+
 endfunction()
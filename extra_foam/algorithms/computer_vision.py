@@ -17,7 +17,7 @@ from .smooth import gaussianBlur
 
 def edge_detect(image, *,
                 kernel_size=3, sigma=1, threshold=(0, 1),
-                mask_nan=True):
+                mask_nan=True, scratch=None):
     """Detect edges in an image.
 
     :param numpy.ndarray image: image data. Shape = (y, x)
@@ -26,13 +26,32 @@ def edge_detect(image, *,
     :param tuple threshold: (first, second) thresholds for the hysteresis
         procedure.
     :param bool mask_nan: whether to mask nan values to 0.
+    :param numpy.ndarray scratch: buffer for storing the intermediate
+        results, which must have the same dtype as the image and
+        shape = (2, y, x). If None, new buffers will be allocated.
+        Its content will be overwritten.
     """
-    masked = image
+    if scratch is None:
+        masked = np.copy(image) if mask_nan else image
+        blurred = np.zeros_like(masked)
+    else:
+        masked, blurred = scratch
+        if mask_nan:
+            np.copyto(masked, image)
+        else:
+            masked = image
+
+        # pixels on the edges are not touched by gaussianBlur
+        edge = (kernel_size - 1) // 2
+        if edge > 0:
+            blurred[:edge] = 0
+            blurred[-edge:] = 0
+            blurred[:, :edge] = 0
+            blurred[:, -edge:] = 0
+
     if mask_nan:
-        masked = np.copy(image)
         mask_image_data(masked, keep_nan=False)
 
-    blurred = np.zeros_like(masked)
     gaussianBlur(masked, blurred, kernel_size, sigma)
     out = np.zeros_like(blurred, dtype=np.uint8)
     cannyEdge(blurred, out, threshold[0], threshold[1])
@@ -48,16 +67,20 @@ def fourier_transform_2d(image, *, logrithmic=True, mask_nan=True):
         of the transform.
     :param bool mask_nan: whether to mask nan values to 0.
 
-    :return numpy.ndarray: transformed image data. Shape = (y, x)
+    :return numpy.ndarray: magnitude of the transformed image data.
+        Shape = (y, x)
     """
-    masked = np.copy(image)
     if mask_nan:
+        masked = np.copy(image)
         mask_image_data(masked, keep_nan=False)
+    else:
+        masked = image
 
-    # TODO: improve performance
-    out = fft.fftshift(fft.fft2(masked, overwrite_x=True))
-
-    np.abs(out, out=out)
+    # pocketfft caches the plans for the recently used shapes
+    out = np.abs(fft.fft2(masked, overwrite_x=mask_nan))
+    # shift the real-valued magnitude instead of the complex transform:
+    # it has the same shape but only half the bytes (float64 vs complex128)
     if logrithmic:
-        np.log10(1 + out, out=out)
-    return out
+        out += 1
+        np.log10(out, out=out)
+    return fft.fftshift(out)
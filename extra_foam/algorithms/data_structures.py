@@ -118,6 +118,46 @@ class _AbstractSequence(Sequence):
         """Construct from array(s)."""
         raise NotImplementedError
 
+    def _extend_buffers(self, buffers, arrays):
+        """Copy a batch of new data points into the buffers.
+
+        :param tuple buffers: 1D buffers which store the data.
+        :param tuple arrays: arrays of the new data points, one for each
+            buffer. They must have the same length.
+        """
+        n = len(arrays[0])
+        if n == 0:
+            return
+
+        max_len = self._max_len
+        if n >= max_len:
+            for buf, arr in zip(buffers, arrays):
+                buf[:max_len] = arr[-max_len:]
+            self._i0 = 0
+            self._len = max_len
+            return
+
+        # data points which are still kept after extending
+        n_kept = min(self._len, max_len - n)
+        end = self._i0 + self._len
+        if end + n > self._OVER_CAPACITY * max_len:
+            # move the kept data to the beginning of the buffers
+            for buf in buffers:
+                buf[:n_kept] = buf[end - n_kept:end]
+            i0 = 0
+        else:
+            i0 = end - n_kept
+        for buf, arr in zip(buffers, arrays):
+            buf[i0 + n_kept:i0 + n_kept + n] = arr
+        self._len = n_kept + n
+
+        if i0 >= max_len:
+            # be consistent with 'append'
+            for buf in buffers:
+                buf[:self._len] = buf[i0:i0 + self._len]
+            i0 = 0
+        self._i0 = i0
+
 
 class SimpleSequence(_AbstractSequence):
     """Store the history of scalar data."""
@@ -148,8 +188,13 @@ class SimpleSequence(_AbstractSequence):
                 self._x[:max_len] = self._x[max_len:]
 
     def extend(self, items):
-        for item in items:
-            self.append(item)
+        """Override."""
+        if hasattr(items, '__len__'):
+            items = np.asarray(items)
+        else:
+            # e.g. generator
+            items = np.fromiter(items, dtype=self._x.dtype)
+        self._extend_buffers((self._x,), (items,))
 
     def reset(self):
         """Override."""
@@ -160,8 +205,7 @@ class SimpleSequence(_AbstractSequence):
     @classmethod
     def from_array(cls, ax, *args, **kwargs):
         instance = cls(*args, **kwargs)
-        for x in ax:
-            instance.append(x)
+        instance.extend(ax)
         return instance
 
 
@@ -265,8 +309,12 @@ class SimplePairSequence(_AbstractSequence):
 
     def extend(self, items):
         """Override."""
-        for item in items:
-            self.append(item)
+        if not hasattr(items, '__len__'):
+            # e.g. generator
+            items = list(items)
+        items = np.asarray(items)
+        if len(items) > 0:
+            self._extend_buffers((self._x, self._y), (items[:, 0], items[:, 1]))
 
     def reset(self):
         """Override."""
@@ -282,8 +330,8 @@ class SimplePairSequence(_AbstractSequence):
                              f"Actual: {len(ax)}, {len(ay)}")
 
         instance = cls(*args, **kwargs)
-        for x, y in zip(ax, ay):
-            instance.append((x, y))
+        instance._extend_buffers((instance._x, instance._y),
+                                 (np.asarray(ax), np.asarray(ay)))
         return instance
 
 
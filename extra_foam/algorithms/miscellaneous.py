@@ -23,9 +23,10 @@ def normalize_auc(y, x, auc_range=None):
 
     :raise ValueError
     """
-    # if y contains only 0 (np.any() is much faster to np.count_nonzero())
-    if not np.any(y):
-        return np.copy(y)
+    # if y contains only 0 (ndarray.any() stops at the first non-zero
+    # element while np.count_nonzero() always scans the whole array)
+    if not y.any():
+        return np.zeros_like(y)
 
     # get the integration
     if auc_range is None:
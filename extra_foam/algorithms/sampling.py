@@ -7,13 +7,16 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
+import functools
+
 import numpy as np
 
 
 def slice_curve(y, x, x_min=None, x_max=None):
     """Slice an x-y plot based on the range of x values.
 
-    x is assumed to be monotonically increasing.
+    x is assumed to be monotonically increasing. The returned arrays are
+    views of the input arrays.
 
     :param numpy.ndarray y: 1D array.
     :param numpy.ndarray x: 1D array.
@@ -23,41 +26,43 @@ def slice_curve(y, x, x_min=None, x_max=None):
     :return: (the sliced x and y)
     :rtype: (numpy.ndarray, numpy.ndarray)
     """
-    if x_min is None:
-        x_min = x.min()
+    lb = 0 if x_min is None else np.searchsorted(x, x_min, side='left')
+    ub = len(x) if x_max is None else np.searchsorted(x, x_max, side='right')
+
+    # caveat: y[lb:ub] is empty if lb >= ub, e.g. x_min > x_max
+    return y[lb:ub], x[lb:ub]
 
-    if x_max is None:
-        x_max = x.max()
 
-    indices = np.where(np.logical_and(x <= x_max, x >= x_min))
-    return y[indices], x[indices]
+# down-sample rate. the rate is fixed at 2 due to the complexity of
+# up-sampling
+_down_samplers = {
+    1: lambda x: x[::2],
+    2: lambda x: x[::2, ::2],
+    # the first dimension is the data ID, which will not be down-sampled
+    3: lambda x: x[:, ::2, ::2],
+}
 
 
-def down_sample(x):
+def down_sample(x, copy=False):
     """Down sample an array.
 
     :param numpy.ndarray x: data.
+    :param bool copy: True for returning a C-contiguous copy instead of
+        a strided view of the input data.
 
     :return numpy.ndarray: down-sampled data.
     """
-    # down-sample rate. the rate is fixed at 2 due to the complexity of
-    # up-sampling
-    rate = 2
-
     if not isinstance(x, np.ndarray):
         raise TypeError("Input must be a numpy.ndarray!")
 
-    if len(x.shape) == 1:
-        return x[::rate]
+    try:
+        ret = _down_samplers[x.ndim](x)
+    except KeyError:
+        raise ValueError("Array dimension > 3!")
 
-    if len(x.shape) == 2:
-        return x[::rate, ::rate]
-
-    if len(x.shape) == 3:
-        # the first dimension is the data ID, which will not be down-sampled
-        return x[:, ::rate, ::rate]
-
-    raise ValueError("Array dimension > 3!")
+    if copy:
+        return np.ascontiguousarray(ret)
+    return ret
 
 
 def up_sample(x, shape):
@@ -96,45 +101,64 @@ def up_sample(x, shape):
     For other target shapes, ValueError will be raised. This implementation
     makes the down-sampling and up-sampling self-consistent.
     """
-    # up-sample rate
-    rate = 2
-
     if not isinstance(x, np.ndarray):
         raise TypeError("Input must be a numpy.ndarray!")
 
     if not isinstance(shape, tuple):
         raise TypeError("shape must be a tuple!")
 
-    msg = 'Array with shape {} cannot be up-sampled to another array with ' \
-          'shape {}'.format(x.shape, shape)
-
-    if len(x.shape) == 1:
-        if len(shape) != len(x.shape) or np.ceil(shape[0]/rate) != x.shape[0]:
-            raise ValueError(msg)
-
-        ret = np.zeros(x.shape[0]*rate)
-        ret[:] = x.repeat(rate)
-        return ret[:shape[0]]
-
-    elif len(x.shape) == 2:
-        if len(shape) != len(x.shape) or \
-                np.ceil(shape[0] / rate) != x.shape[0] or \
-                np.ceil(shape[1] / rate) != x.shape[1]:
-            raise ValueError(msg)
+    return _up_sampler(x.shape, shape)(x)
 
-        ret = np.zeros((x.shape[0]*rate, x.shape[1]*rate))
-        ret[:, :] = x.repeat(rate, axis=0).repeat(rate, axis=1)
-        return ret[:shape[0], :shape[1]]
 
-    elif len(x.shape) == 3:
-        # the first dimension is the data ID, which will not be up-sampled
-        if len(shape) != len(x.shape) or \
-                np.ceil(shape[1] / rate) != x.shape[1] or \
-                np.ceil(shape[2] / rate) != x.shape[2]:
-            raise ValueError(msg)
+@functools.lru_cache(maxsize=32)
+def _up_sampler(in_shape, out_shape):
+    """Return a function which up-samples an array of in_shape to out_shape.
 
-        ret = np.zeros((x.shape[0], x.shape[1]*rate, x.shape[2]*rate))
-        ret[:, :, :] = x.repeat(rate, axis=1).repeat(rate, axis=2)
-        return ret[:, :shape[1], :shape[2]]
+    The shapes are validated only once for each (in_shape, out_shape) pair
+    since the same detector shape is up-sampled for every train.
+    """
+    # up-sample rate
+    rate = 2
 
-    raise ValueError("Array dimension > 3!")
+    ndim = len(in_shape)
+    if ndim == 0 or ndim > 3:
+        raise ValueError("Array dimension > 3!")
+
+    # the first dimension of a 3D array is the data ID, which will not be
+    # up-sampled
+    if len(out_shape) != ndim or any(
+            np.ceil(out_shape[i] / rate) != in_shape[i]
+            for i in range(ndim - 2 if ndim == 3 else 0, ndim)):
+        raise ValueError(
+            'Array with shape {} cannot be up-sampled to another array with '
+            'shape {}'.format(in_shape, out_shape))
+
+    if ndim == 1:
+        n, = in_shape
+        n_out, = out_shape
+
+        def _up_sample(x):
+            ret = np.empty(n*rate)
+            ret.reshape(n, rate)[...] = x[:, None]
+            return ret[:n_out]
+
+    elif ndim == 2:
+        h, w = in_shape
+        h_out, w_out = out_shape
+
+        def _up_sample(x):
+            ret = np.empty((h*rate, w*rate))
+            # write each output element once from a broadcast view of x
+            ret.reshape(h, rate, w, rate)[...] = x[:, None, :, None]
+            return ret[:h_out, :w_out]
+
+    else:
+        n, h, w = in_shape
+        _, h_out, w_out = out_shape
+
+        def _up_sample(x):
+            ret = np.empty((n, h*rate, w*rate))
+            ret.reshape(n, h, rate, w, rate)[...] = x[:, :, None, :, None]
+            return ret[:, :h_out, :w_out]
+
+    return _up_sample
@@ -12,8 +12,36 @@ class TestEdgeDetect(unittest.TestCase):
         img = np.ones((6, 8), dtype=np.float32)
         edge_detect(img)
 
+    def testWithScratch(self):
+        img = np.random.rand(16, 18).astype(np.float32)
+        img[1, 1] = np.nan
+        img_cp = img.copy()
+        scratch = np.empty((2, *img.shape), dtype=np.float32)
+        for kernel_size in [5, 3]:
+            expected = edge_detect(img, kernel_size=kernel_size, threshold=(0.1, 0.2))
+            scratch.fill(np.nan)
+            out = edge_detect(img, kernel_size=kernel_size, threshold=(0.1, 0.2),
+                              scratch=scratch)
+            np.testing.assert_array_equal(expected, out)
+        # input image is not modified
+        np.testing.assert_array_equal(img_cp, img)
+
 
 class TestFourierTransform(unittest.TestCase):
     def testGeneral(self):
         img = np.ones((6, 8), dtype=np.float32)
         fourier_transform_2d(img)
+
+        img = np.random.rand(6, 8).astype(np.float32)
+        img[0, 0] = np.nan
+        img_cp = img.copy()
+        masked = np.nan_to_num(img, nan=0)
+        out = fourier_transform_2d(img)
+        self.assertFalse(np.iscomplexobj(out))
+        np.testing.assert_array_almost_equal(
+            np.log10(1 + np.abs(np.fft.fftshift(np.fft.fft2(masked)))), out, decimal=5)
+        out = fourier_transform_2d(img, logrithmic=False)
+        np.testing.assert_array_almost_equal(
+            np.abs(np.fft.fftshift(np.fft.fft2(masked))), out, decimal=5)
+        # input image is not modified
+        np.testing.assert_array_equal(img_cp, img)
@@ -125,6 +125,30 @@ class TestSequenceData(unittest.TestCase):
         self.assertEqual(0, ax[0])
         self.assertEqual(MAX_LENGTH - 1, ax[-1])
 
+        # ----------------------------
+        # test extend over capacity
+        # ----------------------------
+        hist.reset()
+        hist.extend(np.arange(MAX_LENGTH - 10))
+        for i in range(3):
+            hist.extend(np.arange(60) + 60 * i)
+        np.testing.assert_array_equal(np.arange(80, 180), hist.data())
+        hist.extend(np.arange(2 * MAX_LENGTH + 1))
+        np.testing.assert_array_equal(
+            np.arange(MAX_LENGTH + 1, 2 * MAX_LENGTH + 1), hist.data())
+        hist.append(-1)
+        self.assertEqual(-1, hist[-1])
+        self.assertEqual(MAX_LENGTH + 2, hist[0])
+
+        # ----------------------------
+        # test extend with iterables
+        # ----------------------------
+        hist.reset()
+        hist.extend(i for i in range(3))
+        hist.extend(map(float, [3, 4]))
+        hist.extend(range(5, 7))
+        np.testing.assert_array_equal(np.arange(7), hist.data())
+
         # ----------------------------
         # test constructing from array
         # ----------------------------
@@ -260,6 +284,26 @@ class TestSequenceData(unittest.TestCase):
         hist = SimplePairSequence.from_array([0, 1, 2], [1, 2, 3])
         self.assertEqual(3, len(hist))
 
+        # ----------------------------
+        # test extend over capacity
+        # ----------------------------
+        hist = SimplePairSequence(max_len=MAX_LENGTH)
+        for i in range(3):
+            hist.extend([(j, -j) for j in range(60 * i, 60 * (i + 1))])
+        ax, ay = hist.data()
+        np.testing.assert_array_equal(np.arange(80, 180), ax)
+        np.testing.assert_array_equal(-np.arange(80, 180), ay)
+
+        # ----------------------------
+        # test extend with iterables
+        # ----------------------------
+        hist.reset()
+        hist.extend((j, -j) for j in range(3))
+        hist.extend(zip([3, 4], [-3, -4]))
+        ax, ay = hist.data()
+        np.testing.assert_array_equal(np.arange(5), ax)
+        np.testing.assert_array_equal(-np.arange(5), ay)
+
     def testOneWayAccuPairSequence(self):
         MAX_LENGTH = 100
 
@@ -34,6 +34,11 @@ class TestSampling(unittest.TestCase):
         np.testing.assert_array_equal(y, new_y)
         np.testing.assert_array_equal(x, new_x)
 
+        # the sliced arrays are views
+        new_y, new_x = slice_curve(y, x, 1, 3)
+        self.assertTrue(np.shares_memory(new_y, y))
+        self.assertTrue(np.shares_memory(new_x, x))
+
     def test_downsample(self):
         x1 = np.array([1, 2])
         x1_gt = np.array([1])
@@ -63,6 +68,17 @@ class TestSampling(unittest.TestCase):
                            [3, 4]]])
         self.assertTrue(np.array_equal(x3_gt, down_sample(x3)))
 
+        # test copy
+        ret = down_sample(x22)
+        self.assertTrue(np.shares_memory(ret, x22))
+        ret = down_sample(x22, copy=True)
+        self.assertFalse(np.shares_memory(ret, x22))
+        self.assertTrue(ret.flags.c_contiguous)
+        self.assertTrue(np.array_equal(x2_gt, ret))
+        ret = down_sample(x3, copy=True)
+        self.assertTrue(ret.flags.c_contiguous)
+        self.assertTrue(np.array_equal(x3_gt, ret))
+
         with self.assertRaises(ValueError):
             down_sample(np.arange(16).reshape(2, 2, 2, 2))
 
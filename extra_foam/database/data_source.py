@@ -7,22 +7,72 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
-from collections import abc, namedtuple
-import copy
+from collections import abc
+import sys
 
-from ..algorithms import OrderedSet
 from ..config import config
 
 
-# category: source category, e.g., Motor, DSSC, LPD
-# name: source name, usually the Karabo device ID
-# modules: a list of module indices
-# slicer: pulse slicer for pulse-resolved data
-# vrange: value range
-# ktype: Karabo data type, 1 for pipeline data and 0 for control data
-SourceItem = namedtuple(
-    'SourceItem',
-    ['category', 'name', 'modules', 'property', 'slicer', 'vrange', 'ktype'])
+# shared (read-only) empty view returned for a category without source
+_EMPTY_CATEGORY = dict().keys()
+
+
+class SourceItem:
+    """Data source item.
+
+    Attributes:
+        category (str): source category, e.g., Motor, DSSC, LPD.
+        name (str): source name, usually the Karabo device ID.
+        modules (list): a list of module indices.
+        property (str): property name.
+        slicer (slice): pulse slicer for pulse-resolved data.
+        vrange (tuple): value range.
+        ktype (int): Karabo data type, 1 for pipeline data and 0 for
+            control data.
+        module_names (tuple): source names of the modules.
+        ppt_value_key (str): property name with the ".value" suffix.
+    """
+
+    __slots__ = ['category', 'name', 'modules', 'property', 'slicer',
+                 'vrange', 'ktype', 'module_names', 'ppt_value_key']
+
+    def __init__(self, category, name, modules, property, slicer, vrange,
+                 ktype):
+        self.category = category
+        # Strings which are used as dictionary keys in every train are
+        # interned.
+        self.name = sys.intern(name)
+        self.modules = modules
+        self.property = sys.intern(property)
+        self.slicer = slicer
+        self.vrange = vrange
+        self.ktype = ktype
+
+        # the following are built once instead of every train
+        if modules:
+            prefix, suffix = name.split("*")
+            self.module_names = tuple(
+                sys.intern(f"{prefix}{idx}{suffix}") for idx in modules)
+        else:
+            self.module_names = ()
+        self.ppt_value_key = sys.intern(f"{property}.value")
+
+    def _fields(self):
+        return (self.category, self.name, self.modules, self.property,
+                self.slicer, self.vrange, self.ktype)
+
+    def __eq__(self, other):
+        if not isinstance(other, SourceItem):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SourceItem(category={self.category!r}, " \
+               f"name={self.name!r}, modules={self.modules!r}, " \
+               f"property={self.property!r}, slicer={self.slicer!r}, " \
+               f"vrange={self.vrange!r}, ktype={self.ktype!r})"
 
 
 class SourceCatalog(abc.Collection):
@@ -39,11 +89,16 @@ class SourceCatalog(abc.Collection):
 
         # key: source name, value: SourceItem
         self._items = dict()
-        # key: data category, value: a OrderedSet of source name
+        # partitions of self._items by whether the source has modules
+        self._modular_items = dict()
+        self._non_modular_items = dict()
+        # key: data category, value: a dict of source name (used as an
+        # ordered set)
         self._categories = dict()
 
-        self._main_detector_category = config["DETECTOR"]
+        self._main_detector_category = sys.intern(config["DETECTOR"])
         self._main_detector = ''
+        self._main_detector_item = None
 
     def __contains__(self, src):
         """Override."""
@@ -66,10 +121,20 @@ class SourceCatalog(abc.Collection):
     def items(self):
         return self._items.items()
 
+    def modular_items(self):
+        return self._modular_items.items()
+
+    def non_modular_items(self):
+        return self._non_modular_items.items()
+
     @property
     def main_detector(self):
         return self._main_detector
 
+    @property
+    def main_detector_item(self):
+        return self._main_detector_item
+
     def get_category(self, src):
         return self._items[src].category
 
@@ -85,8 +150,17 @@ class SourceCatalog(abc.Collection):
     def get_type(self, src):
         return self._items[src].ktype
 
+    def get_module_names(self, src):
+        return self._items[src].module_names
+
+    def get_property_value_key(self, src):
+        return self._items[src].ppt_value_key
+
     def from_category(self, ctg):
-        return self._categories.get(ctg, OrderedSet())
+        srcs = self._categories.get(ctg)
+        if srcs is None:
+            return _EMPTY_CATEGORY
+        return srcs.keys()
 
     def add_item(self, *args, **kwargs):
         """Add a source item to the catalog.
@@ -99,43 +173,66 @@ class SourceCatalog(abc.Collection):
         else:
             item = SourceItem(*args, **kwargs)
 
-        src = f"{item.name} {item.property}"
+        # interned since it is used as a dictionary key all over the pipeline
+        src = sys.intern(f"{item.name} {item.property}")
         self._items[src] = item
+        if item.modules:
+            self._modular_items[src] = item
+            self._non_modular_items.pop(src, None)
+        else:
+            self._non_modular_items[src] = item
+            self._modular_items.pop(src, None)
 
         ctg = item.category
-        if ctg not in self._categories:
-            self._categories[ctg] = OrderedSet()
-        self._categories[ctg].add(src)
+        self._categories.setdefault(ctg, dict())[src] = None
 
         if ctg == self._main_detector_category:
             self._main_detector = src
+            self._main_detector_item = item
 
     def remove_item(self, src):
         """Remove an item from the catalog.
 
         :param str src: source name - <device ID>< ><property>.
         """
-        ctg = self._items.__getitem__(src).category
-        self._items.__delitem__(src)
-        self._categories[ctg].remove(src)
-        if not self._categories[ctg]:
+        item = self._items.pop(src)
+        if item.modules:
+            del self._modular_items[src]
+        else:
+            del self._non_modular_items[src]
+
+        ctg = item.category
+        srcs = self._categories[ctg]
+        del srcs[src]
+        if not srcs:
             # avoid category with empty set
-            self._categories.__delitem__(ctg)
+            del self._categories[ctg]
 
         if ctg == self._main_detector_category:
             self._main_detector = ''
+            self._main_detector_item = None
 
     def clear(self):
         self._items.clear()
+        self._modular_items.clear()
+        self._non_modular_items.clear()
         self._categories.clear()
         self._main_detector = ''
+        self._main_detector_item = None
 
     def __copy__(self):
+        # caveat: SourceItems are never modified after being added to a
+        #         catalog (add_item and remove_item replace them), so they
+        #         are shared instead of being deep-copied for every train.
         instance = self.__class__()
-        instance._items = copy.deepcopy(self._items)
-        instance._categories = copy.deepcopy(self._categories)
+        instance._items = self._items.copy()
+        instance._modular_items = self._modular_items.copy()
+        instance._non_modular_items = self._non_modular_items.copy()
+        instance._categories = {
+            k: v.copy() for k, v in self._categories.items()}
         instance._main_detector_category = self._main_detector_category
         instance._main_detector = self._main_detector
+        instance._main_detector_item = self._main_detector_item
         return instance
 
     def __deepcopy__(self, memo):
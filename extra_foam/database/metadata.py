@@ -132,13 +132,8 @@ class MetaProxy(_AbstractProxy):
 
         :param tuple item: a tuple which can be used to construct a SourceItem.
         """
-        ctg, name, modules, ppt, slicer, vrange, ktype = item
-        item_key = Metadata.DATA_SOURCE_ITEMS
-        src = f"{name} {ppt}"
-        item = f"{ctg};{name};{modules};{ppt};{slicer};{vrange};{ktype}"
-        return self._db.pipeline().execute_command(
-            'HSET', item_key, src, item).execute_command(
-            'SADD', f"{item_key}:updated", src).execute()
+        return self._update_data_sources(
+            self._db.pipeline(), [(True, item)]).execute()
 
     @redis_except_handler
     def remove_data_source(self, src):
@@ -146,10 +141,35 @@ class MetaProxy(_AbstractProxy):
 
         :param str src: data source.
         """
+        return self._update_data_sources(
+            self._db.pipeline(), [(False, src)]).execute()
+
+    @redis_except_handler
+    def update_data_sources(self, items):
+        """Add and remove data sources in a single transaction.
+
+        :param list items: a list of (checked, item). If checked is True,
+            item is a tuple which can be used to construct a SourceItem.
+            Otherwise, item is the data source to be removed.
+        """
+        return self._update_data_sources(self._db.pipeline(), items).execute()
+
+    @staticmethod
+    def _update_data_sources(pipe, items):
         item_key = Metadata.DATA_SOURCE_ITEMS
-        return self._db.pipeline().execute_command(
-            'HDEL', item_key, src).execute_command(
-            'SADD', f"{item_key}:updated", src).execute()
+        updated_key = f"{item_key}:updated"
+        for checked, item in items:
+            if checked:
+                ctg, name, modules, ppt, slicer, vrange, ktype = item
+                src = f"{name} {ppt}"
+                pipe.execute_command(
+                    'HSET', item_key, src,
+                    f"{ctg};{name};{modules};{ppt};{slicer};{vrange};{ktype}")
+            else:
+                src = item
+                pipe.execute_command('HDEL', item_key, src)
+            pipe.execute_command('SADD', updated_key, src)
+        return pipe
 
     @redis_except_handler
     def take_snapshot(self, name):
@@ -12,6 +12,7 @@ from itertools import chain
 
 from .base_proxy import _AbstractProxy
 from .db_utils import redis_except_handler
+from .metadata import Metadata
 from ..config import config
 
 
@@ -94,6 +95,23 @@ class MonProxy(_AbstractProxy):
         if query:
             return query[0]
 
+    @redis_except_handler
+    def get_last_tid_and_session(self):
+        """Get the last train ID and the session information in one query.
+
+        :return: None if the connection failed;
+                 otherwise, a tuple of (timestamp, tid) or None if no train
+                 ID has been registered, and a dictionary of the session
+                 information.
+        """
+        pipe = self._db.pipeline()
+        pipe.zrevrangebyscore(
+            self.PERFORMANCE, MAX_TRAIN_ID, 0,
+            start=0, num=1, withscores=True, score_cast_func=int)
+        pipe.execute_command('HGETALL', Metadata.SESSION)
+        query, sess = pipe.execute()
+        return (query[0] if query else None), sess
+
     def get_processor_params(self, proc):
         """Query the metadata for a given processor.
 
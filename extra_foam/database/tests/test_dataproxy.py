@@ -117,6 +117,12 @@ class TestDataProxy(unittest.TestCase):
         self.assertEqual('1', n_drop)
         self.assertEqual('20', n_proc_p)
 
+        self._meta.hset(Metadata.SESSION, 'detector', 'DSSC')
+        last, sess = mon.get_last_tid_and_session()
+        self.assertEqual(1235, last[1])
+        self.assertEqual(mon.get_last_tid(), last)
+        self.assertEqual('DSSC', sess['detector'])
+
     def testSnapshotOperation(self):
         data = {
             Metadata.IMAGE_PROC: {"aaa": '1', "bbb": "(-1, 1)", "ccc": "sea"},
@@ -1,13 +1,32 @@
 import unittest
 from unittest.mock import patch
 import copy
+import sys
 
-from extra_foam.database.data_source import (
-    OrderedSet, SourceCatalog, SourceItem
-)
+from extra_foam.database.data_source import SourceCatalog, SourceItem
 from extra_foam.config import config
 
 
+class TestSourceItem(unittest.TestCase):
+    def testGeneral(self):
+        item = SourceItem('Motor', 'motor_device', [], 'actualPosition', None, (-1, 1), 0)
+        self.assertEqual('actualPosition.value', item.ppt_value_key)
+        self.assertTupleEqual((), item.module_names)
+        self.assertEqual(item, SourceItem(
+            'Motor', 'motor_device', [], 'actualPosition', None, (-1, 1), 0))
+        self.assertNotEqual(item, SourceItem(
+            'Motor', 'motor_device', [], 'actualPosition', None, (-1, 2), 0))
+
+        item_cp = copy.deepcopy(item)
+        self.assertEqual(item, item_cp)
+        self.assertIsNot(item, item_cp)
+
+        item = SourceItem('LPD', 'lpd_*:xtdf', [0, 2], 'image.data', None, None, 1)
+        self.assertTupleEqual(('lpd_0:xtdf', 'lpd_2:xtdf'), item.module_names)
+        self.assertIs(sys.intern('lpd_0:xtdf'), item.module_names[0])
+        self.assertIs(sys.intern('image.data.value'), item.ppt_value_key)
+
+
 @patch.dict(config._data, {"DETECTOR": "DSSC"})
 class TestSourceCatalog(unittest.TestCase):
     def testGeneral(self):
@@ -19,9 +38,12 @@ class TestSourceCatalog(unittest.TestCase):
         src = f"{item.name} {item.property}"
         catalog.add_item(item)
         self.assertEqual(src, catalog.main_detector)
+        self.assertIs(sys.intern(src), next(iter(catalog)))
+        self.assertIs(item, catalog.main_detector_item)
         self.assertEqual(1, len(catalog))
         catalog.remove_item(src)
         self.assertEqual('', catalog.main_detector)
+        self.assertIsNone(catalog.main_detector_item)
         self.assertEqual(0, len(catalog))
 
         src1 = f"motor_device1 actualPosition"
@@ -41,7 +63,21 @@ class TestSourceCatalog(unittest.TestCase):
         item3 = SourceItem('Motor', 'motor_device2', [], 'actualPosition', None, (-1, 1), 0)
         src3 = f"{item3.name} {item3.property}"
         catalog.add_item(item3)
-        self.assertEqual(OrderedSet([src1, src3]), catalog.from_category("Motor"))
+        self.assertListEqual([src1, src3], list(catalog.from_category("Motor")))
+        self.assertListEqual([], list(catalog.from_category("Unknown")))
+        self.assertIs(catalog.from_category("Unknown"), catalog.from_category("Unknown2"))
+        self.assertTupleEqual((), catalog.get_module_names(src3))
+        self.assertEqual("actualPosition.value", catalog.get_property_value_key(src3))
+
+        src4 = "xyz_*:xtdf image.data"
+        catalog.add_item('LPD', 'xyz_*:xtdf', [0, 2], 'image.data', None, None, 1)
+        self.assertTupleEqual(('xyz_0:xtdf', 'xyz_2:xtdf'), catalog.get_module_names(src4))
+        self.assertListEqual([src4], [k for k, _ in catalog.modular_items()])
+        self.assertListEqual([src1, src2, src3], [k for k, _ in catalog.non_modular_items()])
+        catalog.remove_item(src4)
+        self.assertListEqual([], list(catalog.modular_items()))
+        with self.assertRaises(KeyError):
+            catalog.get_module_names(src4)
 
         catalog.clear()
         self.assertEqual(0, len(catalog))
@@ -59,7 +95,19 @@ class TestSourceCatalog(unittest.TestCase):
         catalog_cp = copy.copy(catalog)
         self.assertDictEqual(catalog._items, catalog_cp._items)
         self.assertIsNot(catalog._items, catalog_cp._items)
+        self.assertDictEqual(catalog._non_modular_items, catalog_cp._non_modular_items)
+        for k, v in catalog_cp.non_modular_items():
+            self.assertIs(catalog_cp._items[k], v)
         self.assertDictEqual(catalog._categories, catalog_cp._categories)
         self.assertIsNot(catalog._categories, catalog_cp._categories)
+        self.assertIsNot(catalog._categories['Motor'], catalog_cp._categories['Motor'])
         self.assertEqual(catalog._main_detector_category, catalog_cp._main_detector_category)
         self.assertEqual(catalog._main_detector, catalog_cp._main_detector)
+        self.assertEqual(catalog.main_detector_item, catalog_cp.main_detector_item)
+        self.assertIs(catalog_cp._items[catalog_cp.main_detector], catalog_cp.main_detector_item)
+        # items are shared but the copy is not affected by later changes
+        for k, v in catalog_cp.items():
+            self.assertIs(catalog._items[k], v)
+        catalog.remove_item('xgm_device intensityTD')
+        self.assertIn('xgm_device intensityTD', catalog_cp)
+        self.assertIn('xgm_device intensityTD', dict(catalog_cp.non_modular_items()))
@@ -15,8 +15,8 @@ from .filter_ctrl_widget import FomFilterCtrlWidget
 from .data_source_widget import DataSourceWidget
 from .extension_ctrl_widget import ExtensionCtrlWidget
 from .smart_widgets import (
-    SmartBoundaryLineEdit, SmartLineEdit, SmartSliceLineEdit,
-    SmartStringLineEdit
+    SmartBoundaryLineEdit, SmartFloatLineEdit, SmartLineEdit,
+    SmartSliceLineEdit, SmartStringLineEdit
 )
 from .roi_ctrl_widget import _SingleRoiCtrlWidget, RoiCtrlWidget
 from .roi_fom_ctrl_widget import RoiFomCtrlWidget
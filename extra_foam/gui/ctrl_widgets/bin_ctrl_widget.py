@@ -178,7 +178,7 @@ class BinCtrlWidget(_AbstractCtrlWidget):
         self._table.setMinimumHeight(header_height * (n_row + 2))
         self._table.setMaximumHeight(header_height * (n_row + 3))
 
-    @pyqtSlot(str)
+    @pyqtSlot(int, str)
     def onCategoryChange(self, i_col, category):
         bin_range_le = SmartBoundaryLineEdit(_DEFAULT_BIN_RANGE)
 
@@ -238,7 +238,7 @@ class BinCtrlWidget(_AbstractCtrlWidget):
 
             self.onBinParamChangeCb(i_col)
 
-    @pyqtSlot()
+    @pyqtSlot(int)
     def onBinParamChangeLe(self, i_col):
         device_id = self._table.cellWidget(1, i_col).text()
         ppt = self._table.cellWidget(2, i_col).text()
@@ -248,8 +248,11 @@ class BinCtrlWidget(_AbstractCtrlWidget):
         src = f"{device_id} {ppt}" if device_id and ppt else ""
         self._mediator.onBinParamChange((i_col + 1, src, bin_range, n_bins))
 
-    @pyqtSlot(str)
-    def onBinParamChangeCb(self, i_col):
+    @pyqtSlot(int, str)
+    def onBinParamChangeCb(self, i_col, text=None):
+        # caveat: 'text' is passed by currentTextChanged of the combo boxes.
+        #         Accepting it avoids PyQt's retry of the call with fewer
+        #         arguments on every emit.
         device_id = self._table.cellWidget(1, i_col).currentText()
         ppt = self._table.cellWidget(2, i_col).currentText()
         bin_range = self._table.cellWidget(3, i_col).value()
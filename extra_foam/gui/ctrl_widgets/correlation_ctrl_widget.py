@@ -10,8 +10,7 @@ All rights reserved.
 from collections import OrderedDict
 import functools
 
-from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt
-from PyQt5.QtGui import QDoubleValidator
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QStringListModel, Qt
 from PyQt5.QtWidgets import (
     QCheckBox, QComboBox, QFrame, QGridLayout, QHeaderView, QHBoxLayout,
     QLabel, QPushButton, QTableWidget
@@ -19,7 +18,7 @@ from PyQt5.QtWidgets import (
 
 from .curve_fitting_ctrl_widget import _BaseFittingCtrlWidget
 from .base_ctrl_widgets import _AbstractCtrlWidget
-from .smart_widgets import SmartLineEdit
+from .smart_widgets import SmartFloatLineEdit, SmartLineEdit
 from ..gui_helpers import invert_dict
 from ...config import AnalysisType, config
 from ...database import Metadata as mt
@@ -121,6 +120,24 @@ class CorrelationCtrlWidget(_AbstractCtrlWidget):
             }
         }
 
+        # device ID and property models shared by the combo boxes of all
+        # the parameters in the same category, metadata take precedence
+        # over instrument sources
+        self._category_models = dict()
+        for srcs in (self._src_instrument, self._src_metadata):
+            for ctg, ctg_srcs in srcs.items():
+                self._category_models[ctg] = self._buildCategoryModels(
+                    ctg_srcs)
+
+        # (device ID, property) -> category, instrument sources take
+        # precedence over metadata
+        self._src_categories = dict()
+        for srcs in (self._src_instrument, self._src_metadata):
+            for ctg, ctg_srcs in srcs.items():
+                for device_id, ppts in ctg_srcs.items():
+                    for ppt in ppts:
+                        self._src_categories.setdefault((device_id, ppt), ctg)
+
         self._fitting = _FittingCtrlWidget()
 
         self.initParamTable()
@@ -201,7 +218,7 @@ class CorrelationCtrlWidget(_AbstractCtrlWidget):
                 table.setCellWidget(i_row, i_col, widget)
 
             # Set up "resolution" cell for category ''
-            widget = SmartLineEdit(str(_DEFAULT_RESOLUTION))
+            widget = SmartFloatLineEdit(str(_DEFAULT_RESOLUTION))
             widget.setReadOnly(True)
             table.setCellWidget(3, i_col, widget)
 
@@ -216,12 +233,10 @@ class CorrelationCtrlWidget(_AbstractCtrlWidget):
         header_height = self._table.horizontalHeader().height()
         self._table.setMinimumHeight(header_height * (n_row + 2))
 
-    @pyqtSlot(str)
+    @pyqtSlot(int, str)
     def onCategoryChange(self, i_col, category):
-        resolution_le = SmartLineEdit(str(_DEFAULT_RESOLUTION))
-        validator = QDoubleValidator()
-        validator.setBottom(0.0)
-        resolution_le.setValidator(validator)
+        resolution_le = SmartFloatLineEdit(str(_DEFAULT_RESOLUTION))
+        resolution_le.validator().setBottom(0.0)
 
         if not category or category == self._user_defined_key:
             device_id_le = SmartLineEdit()
@@ -244,15 +259,11 @@ class CorrelationCtrlWidget(_AbstractCtrlWidget):
 
             self.onCorrelationParamChangeLe(i_col)
         else:
-            srcs = self._src_metadata if category in self._src_metadata \
-                else self._src_instrument
-            category_srcs = srcs.get(category, dict())
+            device_id_model, property_model = self._category_models[category]
             device_id_cb = QComboBox()
+            device_id_cb.setModel(device_id_model)
             property_cb = QComboBox()
-            for device_id in category_srcs:
-                device_id_cb.addItem(device_id)
-                for ppt in category_srcs[device_id]:
-                    property_cb.addItem(ppt)
+            property_cb.setModel(property_model)
 
             device_id_cb.currentTextChanged.connect(functools.partial(
                 self.onCorrelationParamChangeCb, i_col))
@@ -267,20 +278,23 @@ class CorrelationCtrlWidget(_AbstractCtrlWidget):
 
             self.onCorrelationParamChangeCb(i_col)
 
-    @pyqtSlot()
+    @pyqtSlot(int)
     def onCorrelationParamChangeLe(self, i_col):
         device_id = self._table.cellWidget(1, i_col).text()
         ppt = self._table.cellWidget(2, i_col).text()
-        res = float(self._table.cellWidget(3, i_col).text())
+        res = self._table.cellWidget(3, i_col).value()
 
         src = f"{device_id} {ppt}" if device_id and ppt else ""
         self._mediator.onCorrelationParamChange((i_col + 1, src, res))
 
-    @pyqtSlot(str)
-    def onCorrelationParamChangeCb(self, i_col):
+    @pyqtSlot(int, str)
+    def onCorrelationParamChangeCb(self, i_col, text=None):
+        # caveat: 'text' is passed by currentTextChanged of the combo boxes.
+        #         Accepting it avoids PyQt's retry of the call with fewer
+        #         arguments on every emit.
         device_id = self._table.cellWidget(1, i_col).currentText()
         ppt = self._table.cellWidget(2, i_col).currentText()
-        res = float(self._table.cellWidget(3, i_col).text())
+        res = self._table.cellWidget(3, i_col).value()
 
         src = f"{device_id} {ppt}" if device_id and ppt else ""
         self._mediator.onCorrelationParamChange((i_col + 1, src, res))
@@ -316,36 +330,47 @@ class CorrelationCtrlWidget(_AbstractCtrlWidget):
         for i in range(_N_PARAMS):
             src = cfg[f'source{i+1}']
             if not src:
-                self._table.cellWidget(0, i).setCurrentText(
-                    self._UNDEFINED_CATEGORY)
-                self.onCategoryChange(i, self._UNDEFINED_CATEGORY)
+                self._setCategory(i, self._UNDEFINED_CATEGORY)
             else:
                 device_id, ppt = src.split(' ')
                 resolution = cfg[f'resolution{i+1}']
                 ctg = self._find_category(device_id, ppt)
 
-                self._table.cellWidget(0, i).setCurrentText(ctg)
-                self.onCategoryChange(i, ctg)
+                self._setCategory(i, ctg)
                 if ctg == self._user_defined_key:
                     self._table.cellWidget(1, i).setText(device_id)
                     self._table.cellWidget(2, i).setText(ppt)
                 else:
-                    self._table.cellWidget(1, i).setCurrentText(device_id)
-                    self._table.cellWidget(2, i).setCurrentText(ppt)
+                    # the parameter change is signaled once by setting
+                    # the resolution below
+                    for i_row, text in ((1, device_id), (2, ppt)):
+                        widget = self._table.cellWidget(i_row, i)
+                        widget.blockSignals(True)
+                        widget.setCurrentText(text)
+                        widget.blockSignals(False)
                 self._table.cellWidget(3, i).setText(resolution)
 
-    def _find_category(self, device_id, ppt):
-        for ctg in self._src_instrument:
-            ctg_srcs = self._src_instrument[ctg]
-            if device_id in ctg_srcs and ppt in ctg_srcs[device_id]:
-                return ctg
-
-        for ctg in self._src_metadata:
-            ctg_srcs = self._src_metadata[ctg]
-            if device_id in ctg_srcs and ppt in ctg_srcs[device_id]:
-                return ctg
+    def _setCategory(self, i_col, category):
+        """Set category and rebuild the row only once."""
+        widget = self._table.cellWidget(0, i_col)
+        widget.blockSignals(True)
+        widget.setCurrentText(category)
+        widget.blockSignals(False)
+        self.onCategoryChange(i_col, category)
+
+    def _buildCategoryModels(self, category_srcs):
+        """Build the device ID and property models of a category."""
+        device_ids = []
+        ppts = []
+        for device_id, device_ppts in category_srcs.items():
+            device_ids.append(device_id)
+            ppts.extend(device_ppts)
+        return (QStringListModel(device_ids, self),
+                QStringListModel(ppts, self))
 
-        return self._user_defined_key
+    def _find_category(self, device_id, ppt):
+        return self._src_categories.get((device_id, ppt),
+                                        self._user_defined_key)
 
     def resetAnalysisType(self):
         self._analysis_type_cb.setCurrentText(
@@ -9,7 +9,7 @@ All rights reserved.
 """
 from PyQt5.QtCore import (
     QAbstractItemModel, QAbstractListModel, QAbstractTableModel, QModelIndex,
-    Qt, QTimer, pyqtSignal
+    QStringListModel, Qt, QTimer, pyqtSignal
 )
 from PyQt5.QtGui import QIntValidator
 from PyQt5.QtWidgets import (
@@ -32,13 +32,24 @@ from ...processes import list_foam_processes
 from ...logger import logger
 
 
+# the detector names are fixed in the class definition of the config
+_DETECTORS = frozenset(config.detectors)
+
+
 class _BaseSmartEditItemDelegate(QStyledItemDelegate):
+    """Base class of the delegates used in DataSourceItemModel."""
     def __init__(self, parent=None):
         super().__init__(parent=parent)
 
+    @staticmethod
+    def _itemData(index):
+        # read the DataSourceTreeItem directly instead of going through
+        # the model's data() method
+        return index.internalPointer().data(index.column())
+
     def setEditorData(self, editor, index):
         """Override."""
-        editor.setTextWithoutSignal(index.data(Qt.DisplayRole))
+        editor.setTextWithoutSignal(self._itemData(index))
 
     def setModelData(self, editor, model, index):
         """Override."""
@@ -56,7 +67,7 @@ class LineEditItemDelegate(_BaseSmartEditItemDelegate):
 
     def createEditor(self, parent, option, index):
         """Override."""
-        value = index.data(Qt.DisplayRole)
+        value = self._itemData(index)
         if not value:
             return
 
@@ -69,7 +80,7 @@ class LineEditItemDelegate(_BaseSmartEditItemDelegate):
 class SliceItemDelegate(_BaseSmartEditItemDelegate):
     def createEditor(self, parent, option, index):
         """Override."""
-        value = index.data(Qt.DisplayRole)
+        value = self._itemData(index)
         if not value:
             return
         return SmartSliceLineEdit(value, parent)
@@ -78,7 +89,7 @@ class SliceItemDelegate(_BaseSmartEditItemDelegate):
 class BoundaryItemDelegate(_BaseSmartEditItemDelegate):
     def createEditor(self, parent, option, index):
         """Override."""
-        value = index.data(Qt.DisplayRole)
+        value = self._itemData(index)
         if not value:
             return
         return SmartBoundaryLineEdit(value, parent)
@@ -118,12 +129,13 @@ class ComboBoxDelegate(QStyledItemDelegate):
     def __init__(self, items, parent=None):
         super().__init__(parent=parent)
 
-        self._items = items
+        # the items are static, so they are shared by all the editors
+        self._model = QStringListModel(list(items.keys()), self)
 
     def createEditor(self, parent, option, index):
         """Override."""
         cb = QComboBox(parent)
-        cb.addItems(self._items.keys())
+        cb.setModel(self._model)
         cb.setCurrentText(index.model().data(index, Qt.DisplayRole))
         return cb
 
@@ -143,6 +155,10 @@ class ComboBoxDelegate(QStyledItemDelegate):
 
 class DataSourceTreeItem:
     """Item used in DataSourceItemModel."""
+
+    __slots__ = ['_children', '_data', '_parent', '_exclusive', '_rank',
+                 '_checked', '_row', '_parsed_slicer', '_parsed_vrange']
+
     def __init__(self, data, *, exclusive=False, parent=None):
         self._children = []
         self._data = data
@@ -154,6 +170,15 @@ class DataSourceTreeItem:
 
         self._checked = False
 
+        # index in the parent's list of children, which is set when the
+        # item is appended
+        self._row = None
+
+        # parsed slicer and value range, which are cached until the
+        # corresponding data is changed
+        self._parsed_slicer = None
+        self._parsed_vrange = None
+
     def child(self, number):
         """Return the child at an index position."""
         try:
@@ -168,7 +193,8 @@ class DataSourceTreeItem:
         """Append a child item."""
         if not isinstance(item, DataSourceTreeItem):
             raise TypeError(f"Child item must be a {self.__class__}")
-        if item not in self._children:
+        if item._row is None:
+            item._row = len(self._children)
             self._children.append(item)
 
     def childCount(self):
@@ -177,8 +203,8 @@ class DataSourceTreeItem:
 
     def row(self):
         """Return the index of child in its parents' list of children."""
-        if self._parent is not None:
-            return self._parent._children.index(self)
+        if self._row is not None:
+            return self._row
         return 0
 
     def columnCount(self):
@@ -207,9 +233,29 @@ class DataSourceTreeItem:
     def vrange(self):
         return self._data[5]
 
+    def parsedSlicer(self):
+        if self._parsed_slicer is None:
+            slicer = self._data[4]
+            self._parsed_slicer = str(parse_slice(slicer)) if slicer else ''
+        return self._parsed_slicer
+
+    def parsedVrange(self):
+        if self._parsed_vrange is None:
+            vrange = self._data[5]
+            self._parsed_vrange = \
+                str(parse_boundary(vrange)) if vrange else ''
+        return self._parsed_vrange
+
     def setData(self, value, column):
         if 0 <= column < len(self._data):
+            if isinstance(self._data, tuple):
+                # rows which are never edited are stored as tuples
+                self._data = list(self._data)
             self._data[column] = value
+            if column == 4:
+                self._parsed_slicer = None
+            elif column == 5:
+                self._parsed_vrange = None
 
     def parent(self):
         return self._parent
@@ -230,23 +276,23 @@ class DataSourceTreeItem:
 class DataSourceItemModel(QAbstractItemModel):
     """Tree model interface for managing data sources."""
 
-    # True/False, tuple/str
-    source_item_toggled_sgn = pyqtSignal(bool, object)
+    # a list of (True/False, tuple/str)
+    source_item_toggled_sgn = pyqtSignal(list)
 
     def __init__(self, parent=None):
         super().__init__(parent=parent)
 
         self._mediator = Mediator()
 
-        self._root = DataSourceTreeItem([
+        self._root = DataSourceTreeItem((
             "", "Type", "Source name", "Property",
-            "Pulse slicer", "Value range"])
+            "Pulse slicer", "Value range"))
         self.setupModelData()
 
         self._matched_srcs = set()
 
         self.source_item_toggled_sgn.connect(
-            self._mediator.onSourceItemToggled)
+            self._mediator.onSourceItemsToggled)
 
     def data(self, index, role=None):
         """Override."""
@@ -268,29 +314,40 @@ class DataSourceItemModel(QAbstractItemModel):
         """Override."""
         if role == Qt.CheckStateRole or role == Qt.EditRole:
             item = self.getItem(index)
+            # toggled source items are emitted in one signal
+            toggled = []
             if role == Qt.CheckStateRole:
-                n_rows = index.model().rowCount(index.parent())
+                if bool(value) == bool(item.isChecked()):
+                    return True
+
                 if item.isExclusive() and not item.isChecked():
-                    for i in range(n_rows):
-                        if i != index.row():
-                            item_sb = self.getItem(index.sibling(i, 0))
-                            if item_sb.isExclusive() and item_sb.isChecked():
-                                item_sb.setChecked(False)
-                                item_sb.setData(False, 0)
-                                self.dataChanged.emit(index.sibling(i, 0),
-                                                      index.siblingAtRow(i))
-                                self.source_item_toggled_sgn.emit(
-                                    False, f'{item_sb.name()} {item_sb.ppt()}')
-                                break
+                    # uncheck the other exclusive siblings and notify the
+                    # view of the affected rows at once
+                    unchecked_rows = []
+                    for i, item_sb in enumerate(item.parent().children()):
+                        if item_sb is not item and item_sb.isExclusive() \
+                                and item_sb.isChecked():
+                            item_sb.setChecked(False)
+                            item_sb.setData(False, 0)
+                            unchecked_rows.append(i)
+                            toggled.append(
+                                (False, f'{item_sb.name()} {item_sb.ppt()}'))
+                    if unchecked_rows:
+                        self.dataChanged.emit(
+                            index.sibling(unchecked_rows[0], 0),
+                            index.siblingAtRow(unchecked_rows[-1]))
 
                 item.setChecked(value)
             else:  # role == Qt.EditRole
+                if value == item.data(index.column()):
+                    # the editor was closed without any change
+                    return True
+
                 old_src_name = item.name()
                 old_ppt = item.ppt()
                 item.setData(value, index.column())
                 # remove registered item with the old device ID and property
-                self.source_item_toggled_sgn.emit(
-                    False, f'{old_src_name} {old_ppt}')
+                toggled.append((False, f'{old_src_name} {old_ppt}'))
 
             main_det = config["DETECTOR"]
             ctg = item.parent().name()
@@ -302,20 +359,19 @@ class DataSourceItemModel(QAbstractItemModel):
             else:
                 modules = []
 
-            slicer = item.slicer()
-            vrange = item.vrange()
             if item.isChecked():
-                self.source_item_toggled_sgn.emit(
-                    item.isChecked(),
+                toggled.append((
+                    True,
                     (ctg, name, str(modules), ppt,
-                     str(parse_slice(slicer)) if slicer else '',
-                     str(parse_boundary(vrange)) if vrange else '',
+                     item.parsedSlicer(),
+                     item.parsedVrange(),
                      item.dtype())
-                )
+                ))
                 item.setData(f"{name} {ppt}" in self._matched_srcs, 0)
             else:
-                self.source_item_toggled_sgn.emit(False, f'{name} {item.ppt()}')
+                toggled.append((False, f'{name} {item.ppt()}'))
                 item.setData(False, 0)
+            self.source_item_toggled_sgn.emit(toggled)
             self.dataChanged.emit(index.siblingAtColumn(0), index)
             return True
         return False
@@ -379,18 +435,22 @@ class DataSourceItemModel(QAbstractItemModel):
     def setupModelData(self):
         """Setup the data for the whole tree."""
         src_categories = dict()
+        pulse_resolved = config["PULSE_RESOLVED"]
         for ctg, srcs in config.pipeline_sources.items():
             ctg_item = DataSourceTreeItem(
-                ["", "", ctg, "", "", ""], exclusive=False, parent=self._root)
+                ("", "", ctg, "", "", ""), exclusive=False, parent=self._root)
             self._root.appendChild(ctg_item)
             src_categories[ctg] = ctg_item
 
-            # train-resolved detectors do not need slicer
-            default_slicer = ':'
-            if ctg in config.detectors and not config["PULSE_RESOLVED"]:
-                default_slicer = ''
-            # for 2D detectors we does not apply pixel-wise filtering for now
-            default_v_range = '-inf, inf' if ctg not in config.detectors else ''
+            if ctg in _DETECTORS:
+                # train-resolved detectors do not need slicer
+                default_slicer = ':' if pulse_resolved else ''
+                # for 2D detectors we does not apply pixel-wise filtering
+                # for now
+                default_v_range = ''
+            else:
+                default_slicer = ':'
+                default_v_range = '-inf, inf'
             for src, ppts in srcs.items():
                 for ppt in ppts:
                     # For now, all pipeline data are exclusive
@@ -403,7 +463,7 @@ class DataSourceItemModel(QAbstractItemModel):
         for ctg, srcs in config.control_sources.items():
             if ctg not in src_categories:
                 ctg_item = DataSourceTreeItem(
-                    ["", "", ctg, "", "", ""],
+                    ("", "", ctg, "", "", ""),
                     exclusive=False, parent=self._root)
                 self._root.appendChild(ctg_item)
                 src_categories[ctg] = ctg_item
@@ -434,7 +494,7 @@ class DataSourceItemModel(QAbstractItemModel):
         user_defined = config["SOURCE_USER_DEFINED_CATEGORY"]
         n_user_defined = 4
         assert user_defined not in src_categories
-        ctg_item = DataSourceTreeItem(["", "", user_defined, "", "", ""],
+        ctg_item = DataSourceTreeItem(("", "", user_defined, "", "", ""),
                                       exclusive=False,
                                       parent=self._root)
         self._root.appendChild(ctg_item)
@@ -451,13 +511,14 @@ class DataSourceItemModel(QAbstractItemModel):
         :param list srcs: a list of source items.
         """
         if self._matched_srcs != srcs:
+            srcs_set = set(srcs)
             for i in range(self.rowCount()):
                 parent_index = self.index(i, 0)
                 parent = self.getItem(parent_index)
                 for j in range(parent.childCount()):
                     index = self.index(j, 0, parent_index)
                     item = self.getItem(index)
-                    found = f"{item.name()} {item.ppt()}" in srcs
+                    found = f"{item.name()} {item.ppt()}" in srcs_set
                     if item.isChecked() and found != item.data(0):
                         item.setData(found, 0)
                         self.dataChanged.emit(index, index)
@@ -738,24 +799,27 @@ class DataSourceWidget(_AbstractCtrlWidget):
         self._con_view.setItemDelegateForColumn(3, self._con_port_delegate)
 
         self._src_view = QTreeView()
+        # all the rows are single-line text
+        self._src_view.setUniformRowHeights(True)
         self._src_tree_model = DataSourceItemModel(self)
         self._src_avail_delegate = self.AvailStateDelegate(self)
         self._src_data_type_delegate = self.DataTypeDelegate(self)
-        self._src_device_delegate = LineEditItemDelegate(self)
-        self._src_ppt_delegate = LineEditItemDelegate(self)
+        # shared by the source name and property columns
+        self._src_line_edit_delegate = LineEditItemDelegate(self)
         self._src_slicer_delegate = SliceItemDelegate(self)
         self._src_boundary_delegate = BoundaryItemDelegate(self)
         self._src_view.setModel(self._src_tree_model)
         self._src_view.setItemDelegateForColumn(0, self._src_avail_delegate)
         self._src_view.setItemDelegateForColumn(1, self._src_data_type_delegate)
-        self._src_view.setItemDelegateForColumn(2, self._src_device_delegate)
-        self._src_view.setItemDelegateForColumn(3, self._src_ppt_delegate)
+        self._src_view.setItemDelegateForColumn(2, self._src_line_edit_delegate)
+        self._src_view.setItemDelegateForColumn(3, self._src_line_edit_delegate)
         self._src_view.setItemDelegateForColumn(4, self._src_slicer_delegate)
         self._src_view.setItemDelegateForColumn(5, self._src_boundary_delegate)
 
         self._monitor_tb = QTabWidget()
 
         self._avail_src_view = QListView()
+        self._avail_src_view.setUniformItemSizes(True)
         self._avail_src_model = DataSourceListModel()
         self._avail_src_view.setModel(self._avail_src_model)
 
@@ -809,9 +873,12 @@ class DataSourceWidget(_AbstractCtrlWidget):
             QHeaderView.Stretch)
 
         self._src_view.setIndentation(self._src_view.indentation()/2)
-        self._src_view.expandToDepth(1)
+        # expand and resize without repainting in between
+        self._src_view.setUpdatesEnabled(False)
+        self._src_view.expandAll()
         for i in range(4):
             self._src_view.resizeColumnToContents(i)
+        self._src_view.setUpdatesEnabled(True)
         for i in range(2):
             self._src_view.header().setSectionResizeMode(
                 i, QHeaderView.Fixed)
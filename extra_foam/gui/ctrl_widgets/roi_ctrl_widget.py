@@ -86,10 +86,16 @@ class _SingleRoiCtrlWidget(QWidget):
         self.setLayout(layout)
 
     def initConnections(self):
-        self._width_le.value_changed_sgn.connect(self.onRoiSizeEdited)
-        self._height_le.value_changed_sgn.connect(self.onRoiSizeEdited)
-        self._px_le.value_changed_sgn.connect(self.onRoiPositionEdited)
-        self._py_le.value_changed_sgn.connect(self.onRoiPositionEdited)
+        # parse the confirmed text once here instead of looking up
+        # sender() and re-reading text() inside the slots
+        self._width_le.value_changed_sgn.connect(
+            lambda x: self.onRoiSizeEdited(w=int(x)))
+        self._height_le.value_changed_sgn.connect(
+            lambda x: self.onRoiSizeEdited(h=int(x)))
+        self._px_le.value_changed_sgn.connect(
+            lambda x: self.onRoiPositionEdited(x=int(x)))
+        self._py_le.value_changed_sgn.connect(
+            lambda x: self.onRoiPositionEdited(y=int(x)))
 
         self._roi.sigRegionChangeFinished.connect(
             self.onRoiGeometryChangeFinished)
@@ -115,16 +121,12 @@ class _SingleRoiCtrlWidget(QWidget):
         self.roi_geometry_change_sgn.emit(
             (self._roi.index, state == Qt.Checked, 0, x, y, w, h))
 
-    @pyqtSlot(object)
-    def onRoiPositionEdited(self, value):
-        x, y = [int(v) for v in self._roi.pos()]
+    def onRoiPositionEdited(self, *, x=None, y=None):
+        x0, y0 = self._roi.pos()
+        x = int(x0) if x is None else x
+        y = int(y0) if y is None else y
         w, h = [int(v) for v in self._roi.size()]
 
-        if self.sender() == self._px_le:
-            x = int(self._px_le.text())
-        elif self.sender() == self._py_le:
-            y = int(self._py_le.text())
-
         # If 'update' == False, the state change will be remembered
         # but not processed and no signals will be emitted.
         self._roi.setPos((x, y), update=False)
@@ -137,14 +139,11 @@ class _SingleRoiCtrlWidget(QWidget):
         self.roi_geometry_change_sgn.emit(
             (self._roi.index, state, 0, x, y, w, h))
 
-    @pyqtSlot(object)
-    def onRoiSizeEdited(self, value):
+    def onRoiSizeEdited(self, *, w=None, h=None):
         x, y = [int(v) for v in self._roi.pos()]
-        w, h = [int(v) for v in self._roi.size()]
-        if self.sender() == self._width_le:
-            w = int(self._width_le.text())
-        elif self.sender() == self._height_le:
-            h = int(self._height_le.text())
+        w0, h0 = self._roi.size()
+        w = int(w0) if w is None else w
+        h = int(h0) if h is None else h
 
         # If 'update' == False, the state change will be remembered
         # but not processed and no signals will be emitted.
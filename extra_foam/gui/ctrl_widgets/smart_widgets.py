@@ -8,7 +8,7 @@ Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
 from PyQt5.QtCore import pyqtSignal, QRegExp, Qt
-from PyQt5.QtGui import QRegExpValidator, QValidator
+from PyQt5.QtGui import QDoubleValidator, QRegExpValidator, QValidator
 from PyQt5.QtWidgets import QLineEdit
 
 from ..misc_widgets import FColor
@@ -63,11 +63,15 @@ class SmartLineEdit(QLineEdit):
             return super().keyPressEvent(event)
 
     def onReturnPressed(self):
-        self._cached = self.text()
         if hasattr(self, "Validator"):
-            self.value_changed_sgn.emit(self.Validator.parse(self.text()))
+            self._confirm(self.Validator.parse(self.text()))
         else:
-            self.value_changed_sgn.emit(self.text())
+            self._confirm(self.text())
+
+    def _confirm(self, value):
+        """Cache the confirmed text and emit its value."""
+        self._cached = self.text()
+        self.value_changed_sgn.emit(value)
 
         self.setStyleSheet("QLineEdit { background: rgb(255, 255, 255)}")
         self._text_modified = False
@@ -100,6 +104,39 @@ class SmartStringLineEdit(SmartLineEdit):
         self.setValidator(QRegExpValidator(QRegExp('^(?!\s*$).+')))
 
 
+class SmartFloatLineEdit(SmartLineEdit):
+    """SmartFloatLineEdit class.
+
+    The float value is parsed once when the input is confirmed.
+    """
+
+    value_changed_sgn = pyqtSignal(object)
+
+    class Validator(QDoubleValidator):
+        def __init__(self, parent=None):
+            super().__init__(parent=parent)
+
+        @staticmethod
+        def parse(s):
+            return float(s)
+
+    def __init__(self, content, parent=None):
+        super().__init__(content, parent=parent)
+
+        self._value = self.Validator.parse(content)
+
+        self.setValidator(self.Validator())
+
+    def onReturnPressed(self):
+        """Override."""
+        self._value = self.Validator.parse(self.text())
+        self._confirm(self._value)
+
+    def value(self):
+        """Override."""
+        return self._value
+
+
 class SmartBoundaryLineEdit(SmartLineEdit):
 
     class Validator(QValidator):
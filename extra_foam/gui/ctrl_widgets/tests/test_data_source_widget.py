@@ -204,56 +204,71 @@ class TestDataSourceWidget(unittest.TestCase, _RawDataMixin):
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(0, 0, dssc_ctg), True, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
-        self.assertTrue(spy[0][0])
-        self.assertTupleEqual(('DSSC', 'A', '[]', 'a', '[None, None]', '', 1), spy[0][1])
+        self.assertEqual(1, len(spy[0][0]))
+        self.assertTrue(spy[0][0][0][0])
+        self.assertTupleEqual(('DSSC', 'A', '[]', 'a', '[None, None]', '', 1), spy[0][0][0][1])
         # check availability
         self.assertTrue(model.data(model.index(0, 0, dssc_ctg), Qt.DisplayRole))
 
+        spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
+        # check a checked source
+        model.setData(model.index(0, 0, dssc_ctg), True, Qt.CheckStateRole)
+        self.assertEqual(0, len(spy))
+
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # change device ID
         model.setData(model.index(0, 2, dssc_ctg), 'A+', Qt.EditRole)
-        self.assertEqual(2, len(spy))
+        self.assertEqual(1, len(spy))
+        self.assertEqual(2, len(spy[0][0]))
         # check signal for deleting old source
-        self.assertFalse(spy[0][0])
-        self.assertEqual('A a', spy[0][1])
+        self.assertFalse(spy[0][0][0][0])
+        self.assertEqual('A a', spy[0][0][0][1])
         # check signal for adding new source
-        self.assertTrue(spy[1][0])
-        self.assertTupleEqual(('DSSC', 'A+', '[]', 'a', '[None, None]', '', 1), spy[1][1])
+        self.assertTrue(spy[0][0][1][0])
+        self.assertTupleEqual(('DSSC', 'A+', '[]', 'a', '[None, None]', '', 1), spy[0][0][1][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # change property
         model.setData(model.index(0, 3, dssc_ctg), 'a-', Qt.EditRole)
-        self.assertEqual(2, len(spy))
+        self.assertEqual(1, len(spy))
+        self.assertEqual(2, len(spy[0][0]))
         # check signal for deleting old source
-        self.assertFalse(spy[0][0])
-        self.assertEqual('A+ a', spy[0][1])
+        self.assertFalse(spy[0][0][0][0])
+        self.assertEqual('A+ a', spy[0][0][0][1])
         # check signal for adding new source
-        self.assertTrue(spy[1][0])
-        self.assertTupleEqual(('DSSC', 'A+', '[]', 'a-', '[None, None]', '', 1), spy[1][1])
+        self.assertTrue(spy[0][0][1][0])
+        self.assertTupleEqual(('DSSC', 'A+', '[]', 'a-', '[None, None]', '', 1), spy[0][0][1][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # change slicer
         model.setData(model.index(0, 4, dssc_ctg), '::2', Qt.EditRole)
-        self.assertEqual(2, len(spy))
+        self.assertEqual(1, len(spy))
+        self.assertEqual(2, len(spy[0][0]))
         # check signal for deleting old source
-        self.assertFalse(spy[0][0])
+        self.assertFalse(spy[0][0][0][0])
         # deleting does not check slicer
         # check signal for adding new source
-        self.assertTrue(spy[1][0])
-        self.assertTupleEqual(('DSSC', 'A+', '[]', 'a-', '[None, None, 2]', '', 1), spy[1][1])
+        self.assertTrue(spy[0][0][1][0])
+        self.assertTupleEqual(('DSSC', 'A+', '[]', 'a-', '[None, None, 2]', '', 1), spy[0][0][1][1])
+
+        spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
+        # set the same slicer
+        model.setData(model.index(0, 4, dssc_ctg), '::2', Qt.EditRole)
+        self.assertEqual(0, len(spy))
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # change a DSSC source
         model._matched_srcs = ['B b']
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(1, 0, dssc_ctg), True, Qt.CheckStateRole)
-        self.assertEqual(2, len(spy))
+        self.assertEqual(1, len(spy))
+        self.assertEqual(2, len(spy[0][0]))
         # check signal for deleting old source ('DSSC' is an exclusive category)
-        self.assertFalse(spy[0][0])
-        self.assertEqual('A+ a-', spy[0][1])
+        self.assertFalse(spy[0][0][0][0])
+        self.assertEqual('A+ a-', spy[0][0][0][1])
         # check signal for adding new source
-        self.assertTrue(spy[1][0])
-        self.assertTupleEqual(('DSSC', 'B', '[]', 'b', '[None, None]', '', 1), spy[1][1])
+        self.assertTrue(spy[0][0][1][0])
+        self.assertTupleEqual(('DSSC', 'B', '[]', 'b', '[None, None]', '', 1), spy[0][0][1][1])
         # check availability
         self.assertFalse(model.data(model.index(0, 0, dssc_ctg), Qt.DisplayRole))
         self.assertTrue(model.data(model.index(1, 0, dssc_ctg), Qt.DisplayRole))
@@ -263,9 +278,10 @@ class TestDataSourceWidget(unittest.TestCase, _RawDataMixin):
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(1, 0, dssc_ctg), False, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
+        self.assertEqual(1, len(spy[0][0]))
         # check signal for deleting old source
-        self.assertFalse(spy[0][0])
-        self.assertEqual('B b', spy[0][1])
+        self.assertFalse(spy[0][0][0][0])
+        self.assertEqual('B b', spy[0][0][0][1])
         # check availability
         self.assertFalse(model.data(model.index(1, 0, dssc_ctg), Qt.DisplayRole))
 
@@ -296,42 +312,48 @@ class TestDataSourceWidget(unittest.TestCase, _RawDataMixin):
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(2, 0, xgm_ctg), True, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
-        self.assertTupleEqual(('XGM', 'XA', '[]', 'xpos', '', '(-inf, inf)', 0), spy[0][1])
+        self.assertEqual(1, len(spy[0][0]))
+        self.assertTupleEqual(('XGM', 'XA', '[]', 'xpos', '', '(-inf, inf)', 0), spy[0][0][0][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(1, 0, xgm_ctg), True, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
-        self.assertTupleEqual(('XGM', 'XA', '[]', 'flux', '', '(-inf, inf)', 0), spy[0][1])
+        self.assertEqual(1, len(spy[0][0]))
+        self.assertTupleEqual(('XGM', 'XA', '[]', 'flux', '', '(-inf, inf)', 0), spy[0][0][0][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(0, 0, xgm_ctg), True, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
-        self.assertTupleEqual(('XGM', 'XA', '[]', 'intensity', '[None, None]', '(-inf, inf)', 1), spy[0][1])
+        self.assertEqual(1, len(spy[0][0]))
+        self.assertTupleEqual(('XGM', 'XA', '[]', 'intensity', '[None, None]', '(-inf, inf)', 1), spy[0][0][0][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(2, 0, xgm_ctg), False, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
-        self.assertEqual('XA xpos', spy[0][1])
+        self.assertEqual(1, len(spy[0][0]))
+        self.assertEqual('XA xpos', spy[0][0][0][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # FIXME: 'setData' does not care about which the column index with CheckStateRole.
         model.setData(model.index(0, 0, xgm_ctg), False, Qt.CheckStateRole)
         self.assertEqual(1, len(spy))
-        self.assertEqual('XA intensity', spy[0][1])
+        self.assertEqual(1, len(spy[0][0]))
+        self.assertEqual('XA intensity', spy[0][0][0][1])
 
         spy = QtTest.QSignalSpy(model.source_item_toggled_sgn)
         # change slicer
         model.setData(model.index(1, 5, xgm_ctg), '-1, 1', Qt.EditRole)
-        self.assertEqual(2, len(spy))
+        self.assertEqual(1, len(spy))
+        self.assertEqual(2, len(spy[0][0]))
         # delete old source
-        self.assertFalse(spy[0][0])
+        self.assertFalse(spy[0][0][0][0])
         # deleting does not check range
         # add new source
-        self.assertTrue(spy[1][0])
-        self.assertTupleEqual(('XGM', 'XA', '[]', 'flux', '', '(-1.0, 1.0)', 0), spy[1][1])
+        self.assertTrue(spy[0][0][1][0])
+        self.assertTupleEqual(('XGM', 'XA', '[]', 'flux', '', '(-1.0, 1.0)', 0), spy[0][0][1][1])
 
     @patch.dict(config._data, {"PULSE_RESOLVED": False})
     @patch.object(ConfigWrapper, "pipeline_sources", new_callable=PropertyMock)
@@ -5,8 +5,8 @@ from PyQt5.QtCore import Qt
 
 from extra_foam.gui import mkQApp
 from extra_foam.gui.ctrl_widgets.smart_widgets import (
-    SmartLineEdit, SmartBoundaryLineEdit, SmartIdLineEdit,
-    SmartSliceLineEdit, SmartStringLineEdit
+    SmartLineEdit, SmartBoundaryLineEdit, SmartFloatLineEdit,
+    SmartIdLineEdit, SmartSliceLineEdit, SmartStringLineEdit
 )
 from extra_foam.logger import logger
 
@@ -63,6 +63,28 @@ class TestSmartLineEdit(unittest.TestCase):
         QTest.keyPress(widget, Qt.Key_Enter)
         self.assertEqual(3, len(spy))
 
+    def testSmartFloatLineEdit(self):
+        # test initialization with invalid content
+        with self.assertRaises(ValueError):
+            SmartFloatLineEdit("a")
+
+        widget = SmartFloatLineEdit("0.1")
+        self.assertEqual(0.1, widget.value())
+        spy = QSignalSpy(widget.value_changed_sgn)
+
+        # the value is not updated before the input is confirmed
+        widget.clear()
+        QTest.keyClicks(widget, "1.5")
+        self.assertEqual(0.1, widget.value())
+        QTest.keyPress(widget, Qt.Key_Enter)
+        self.assertEqual(1.5, widget.value())
+        self.assertEqual(1, len(spy))
+        self.assertEqual(1.5, spy[0][0])
+
+        widget.setText("2")
+        self.assertEqual(2.0, widget.value())
+        self.assertEqual(2, len(spy))
+
     def testSmartBoundaryLineEdit(self):
         # require at least one argument for initialization
         with self.assertRaises(TypeError):
@@ -8,12 +8,18 @@ Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
 import os.path as osp
+import re
 
 from PyQt5.QtCore import QSize
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QPushButton
 
 
+# an item in a comma-separated ID list: ":", "start" or "start:end[:inc]"
+_ID_ITEM_RE = re.compile(
+    r"\s*(?:(:)|([+-]?\d+)(?:\s*:\s*([+-]?\d+)(?:\s*:\s*([+-]?\d+))?)?)\s*")
+
+
 def parse_boundary(text):
     """Parse a string which represents the boundary of a value.
 
@@ -76,55 +82,37 @@ def parse_id(text):
 
     parse_id(":") == [-1]
     """
-    def parse_item(v):
-        if not v:
-            return []
-
-        if v.strip() == ':':
-            return [-1]
-
-        if ':' in v:
-            try:
-                x = v.split(':')
-                if len(x) < 2 or len(x) > 3:
-                    raise ValueError("The input is incomprehensible!")
+    ret = set()
+    # first split string by comma, then parse them separately
+    for item in text.split(","):
+        if not item or item.isspace():
+            continue
 
-                start = int(x[0].strip())
-                if start < 0:
-                    raise ValueError("Pulse index cannot be negative!")
-                end = int(x[1].strip())
+        m = _ID_ITEM_RE.fullmatch(item)
+        if m is None:
+            raise ValueError(f"Invalid input: {item.strip()!r}")
 
-                if len(x) == 3:
-                    inc = int(x[2].strip())
-                    if inc <= 0:
-                        raise ValueError(
-                            "Increment must be a positive integer!")
-                else:
-                    inc = 1
+        colon, start, end, inc = m.groups()
+        if colon is not None:
+            ret.add(-1)
+            continue
 
-                return list(range(start, end, inc))
+        start = int(start)
+        if start < 0:
+            raise ValueError("Pulse index cannot be negative!")
 
-            except Exception as e:
-                raise ValueError("Invalid input: " + repr(e))
+        if end is None:
+            ret.add(start)
+            continue
 
+        if inc is None:
+            inc = 1
         else:
-            try:
-                v = int(v)
-                if v < 0:
-                    raise ValueError("Pulse index cannot be negative!")
-            except Exception as e:
-                raise ValueError("Invalid input: " + repr(e))
+            inc = int(inc)
+            if inc <= 0:
+                raise ValueError("Increment must be a positive integer!")
 
-        return v
-
-    ret = set()
-    # first split string by comma, then parse them separately
-    for item in text.split(","):
-        item = parse_item(item.strip())
-        if isinstance(item, int):
-            ret.add(item)
-        else:
-            ret.update(item)
+        ret.update(range(start, int(end), inc))
 
     return sorted(ret)
 
@@ -146,24 +134,20 @@ def parse_slice(text):
     parse_slice("1:2") == [1, 2]
     parse_slice("0:10:2") == [0, 10, 2]
     """
-    err_msg = f"Failed to convert '{text}' to a slice object."
-
     if text:
         parts = text.split(':')
         if len(parts) == 1:
             # slice(stop)
             parts = [None, parts[0]]
         # else: slice(start, stop[, step])
-    else:
-        raise ValueError(err_msg)
 
-    try:
-        ret = [int(p) if p else None for p in parts]
-        if len(ret) > 3:
-            raise ValueError(err_msg)
-        return ret
-    except Exception:
-        raise ValueError(err_msg)
+        if len(parts) <= 3:
+            try:
+                return [int(p) if p else None for p in parts]
+            except ValueError:
+                pass
+
+    raise ValueError(f"Failed to convert '{text}' to a slice object.")
 
 
 def parse_slice_inv(text):
@@ -71,11 +71,8 @@ class Mediator(QObject):
 
         self.connection_change_sgn.emit(connections)
 
-    def onSourceItemToggled(self, checked: bool, item):
-        if checked:
-            self._meta.add_data_source(item)
-        else:
-            self._meta.remove_data_source(item)
+    def onSourceItemsToggled(self, items: list):
+        self._meta.update_data_sources(items)
 
     def onCalGainCorrection(self, value: bool):
         self._meta.hset(mt.IMAGE_PROC, "correct_gain", str(value))
@@ -47,6 +47,9 @@ class TestGUI(unittest.TestCase):
         self.assertEqual([0, 1, 2, 3, 4], parse_id("0:3, 1:5"))
         self.assertEqual([], parse_id("4:4"))
         self.assertEqual([0, 2, 4, 6, 8], parse_id("0:10:2"))
+        # explicit plus sign
+        self.assertEqual([0, 2, 4], parse_id("+0:+6:+2"))
+        self.assertEqual([2, 3], parse_id(" +2, 3"))
 
         invalid_inputs = ["1, 2, ,a", "1:", ":1", "-1:3", "2:a", "a:b",
                           "1:2:3:4", "4:1:-1"]
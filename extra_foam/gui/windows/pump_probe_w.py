@@ -101,6 +101,10 @@ class PumpProbeWindow(_AbstractPlotWindow):
         """Initialization."""
         super().__init__(*args, **kwargs)
 
+        # The window has already been shown. Do not repaint it until
+        # all the widgets are in place.
+        self.setUpdatesEnabled(False)
+
         self._ctrl_widget = self.createCtrlWidget(PumpProbeCtrlWidget)
 
         self._pp_fom = PumpProbeFomPlot(parent=self)
@@ -116,7 +120,8 @@ class PumpProbeWindow(_AbstractPlotWindow):
         self.resize(self._TOTAL_W, self._TOTAL_H)
         self.setMinimumSize(0.6*self._TOTAL_W, 0.6*self._TOTAL_H)
 
-        self.update()
+        # re-enabling updates schedules a single repaint
+        self.setUpdatesEnabled(True)
 
     def initUI(self):
         """Override."""
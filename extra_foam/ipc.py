@@ -285,19 +285,26 @@ class ImageMaskSub:
         :return numpy.ndarray: the updated mask.
         """
         sub = self._sub
-        updated = False
 
         if mask is None:
             mask = np.zeros(shape, dtype=np.bool)
 
-        # process all messages related to mask
+        # collect all messages related to mask
+        msgs = []
+        # 'set' replaces the whole mask, so the operations before the
+        # last one of them can be skipped
+        i_start = 0
         while True:
             msg = sub.get_message(ignore_subscribe_messages=True)
             if msg is None:
                 break
 
             topic = msg['channel'].decode("utf-8").split(":")[-1]
-            data = msg['data']
+            if topic == 'set':
+                i_start = len(msgs)
+            msgs.append((topic, msg['data']))
+
+        for topic, data in msgs[i_start:]:
             if topic == 'set':
                 mask = deserialize_image(data, is_mask=True)
             elif topic in ['draw', 'erase']:
@@ -311,9 +318,7 @@ class ImageMaskSub:
             else:  # data == 'remove'
                 mask.fill(False)
 
-            updated = True
-
-        return updated, mask
+        return bool(msgs), mask
 
 
 class CalConstantsPub:
@@ -99,6 +99,9 @@ class MovingAverageArray:
 
         self._copy_first = copy_first
 
+        # buffer used for updating non-image data in place
+        self._buf = None
+
     def __get__(self, instance, instance_type):
         if instance is None:
             return self
@@ -109,29 +112,38 @@ class MovingAverageArray:
         if data is None:
             self._data = None
             self._count = 0
+            self._buf = None
             return
 
         if self._data is not None and self._window > 1 and \
                 self._count <= self._window and data.shape == self._data.shape:
             if self._count < self._window:
                 self._count += 1
-                if data.ndim in (2, 3):
-                    movingAvgImageData(self._data, data, self._count)
-                else:
-                    self._data += (data - self._data) / self._count
-            else:  # self._count == self._window
-                # here is an approximation
-                if data.ndim in (2, 3):
-                    movingAvgImageData(self._data, data, self._count)
-                else:
-                    self._data += (data - self._data) / self._count
+            # else: self._count == self._window, here is an approximation
+
+            if data.ndim in (2, 3):
+                movingAvgImageData(self._data, data, self._count)
+            else:
+                self._update_in_place(data)
         else:
             self._data = data.copy() if self._copy_first else data
             self._count = 1
 
+    def _update_in_place(self, data):
+        ma = self._data
+        buf = self._buf
+        if buf is None or buf.shape != ma.shape or buf.dtype != ma.dtype:
+            buf = np.empty_like(ma)
+            self._buf = buf
+
+        np.subtract(data, ma, out=buf)
+        buf /= self._count
+        ma += buf
+
     def __delete__(self, instance):
         self._data = None
         self._count = 0
+        self._buf = None
 
     @property
     def window(self):
@@ -65,41 +65,41 @@ class DataTransformer:
                 f"Received data sources with different train IDs: {tids}")
 
         tid = tids.pop()
-        for src, item in catalog.items():
-            src_name, modules, src_ppt = item.name, item.modules, item.property
-
-            if modules:
-                prefix, suffix = src_name.split("*")
-                new_raw[src] = dict()
-                module_data = new_raw[src]
-                n_found = 0
-                for idx in modules:
-                    module_name = f"{prefix}{idx}{suffix}"
-                    if module_name in raw:
-                        module_data[module_name] = raw[module_name]
-                        n_found += 1
-
-                if n_found == 0:
-                    # there is no module data
-                    continue
-                else:
-                    new_meta[src] = {
-                        'train_id': tid, 'source_type': source_type,
-                    }
-            else:
-                try:
-                    # caveat: the sequence matters because of property
-                    try:
-                        new_raw[src] = raw[src_name][src_ppt]
-                    except KeyError:
-                        new_raw[src] = raw[src_name][f"{src_ppt}.value"]
-                except KeyError:
-                    # if the requested source or property is not in the data
+        # The metadata are the same for all the sources in a train and
+        # thus shared. It must not be modified afterwards.
+        src_meta = {'train_id': tid, 'source_type': source_type}
+
+        for src, item in catalog.modular_items():
+            module_data = dict()
+            for module_name in item.module_names:
+                # one lookup per module
+                v = raw.get(module_name)
+                if v is not None:
+                    module_data[module_name] = v
+
+            if not module_data:
+                # there is no module data
+                continue
+
+            new_raw[src] = module_data
+            new_meta[src] = src_meta
+
+        for src, item in catalog.non_modular_items():
+            src_data = raw.get(item.name)
+            if src_data is None:
+                # if the requested source is not in the data
+                continue
+
+            # caveat: the sequence matters because of property
+            v = src_data.get(item.property)
+            if v is None:
+                v = src_data.get(item.ppt_value_key)
+                if v is None:
+                    # if the requested property is not in the data
                     continue
+            new_raw[src] = v
 
-                new_meta[src] = {
-                    'train_id': tid, 'source_type': source_type,
-                }
+            new_meta[src] = src_meta
 
         return new_raw, new_meta, tid
 
@@ -21,9 +21,16 @@ import msgpack
 from karabo_bridge import Client, deserialize
 
 from ..config import config
+from ..logger import logger
 from ..utils import run_in_thread
 
 
+if msgpack.Packer.__module__ == 'msgpack.fallback':
+    # the pure-Python implementation is an order of magnitude slower
+    logger.warning("msgpack C extension is not available! Falling back to "
+                   "the pure-Python implementation.")
+
+
 class BridgeProxy:
     """A proxy bridge which can connect to more than one server.
 
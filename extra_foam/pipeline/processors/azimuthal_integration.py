@@ -25,6 +25,11 @@ from extra_foam.algorithms import (
     energy2wavelength, find_peaks_1d, mask_image_data
 )
 
+# shared by all the azimuthal integration processors, which are run one
+# after another in the same pipeline. Threads are only started on the
+# first submission and joined at interpreter exit.
+_executor = ThreadPoolExecutor(max_workers=4)
+
 
 class _AzimuthalIntegProcessorBase(_BaseProcessor):
     """Base class for AzimuthalIntegProcessors.
@@ -183,13 +188,12 @@ class AzimuthalIntegProcessorPulse(_AzimuthalIntegProcessorBase):
             return integ1d(masked, integ_points, mask=mask)
 
         intensities = []  # pulsed A.I.
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            for i, ret in zip(range(len(assembled)),
-                              executor.map(_integrate1d_imp,
-                                           range(len(assembled)))):
-                if i == 0:
-                    momentum = ret.radial
-                intensities.append(ret.intensity)
+        for i, ret in zip(range(len(assembled)),
+                          _executor.map(_integrate1d_imp,
+                                        range(len(assembled)))):
+            if i == 0:
+                momentum = ret.radial
+            intensities.append(ret.intensity)
 
         # intensities = self._normalize_fom(
         #     processed, np.array(intensities), self._normalizer,
@@ -301,14 +305,12 @@ class AzimuthalIntegProcessorTrain(_AzimuthalIntegProcessorBase):
             mask_off = pp.off.mask
 
             if image_on is not None and image_off is not None:
-                with ThreadPoolExecutor(max_workers=2) as executor:
-                    on_off_rets = executor.map(
-                        lambda img, npts, msk: integ1d(img, npts, mask=msk),
-                        (image_on, image_off),
-                        (integ_points, integ_points),
-                        (mask_on, mask_off)
-                    )
-                on_ret, off_ret = on_off_rets
+                on_ret, off_ret = _executor.map(
+                    lambda img, npts, msk: integ1d(img, npts, mask=msk),
+                    (image_on, image_off),
+                    (integ_points, integ_points),
+                    (mask_on, mask_off)
+                )
 
                 momentum = on_ret.radial
 
@@ -236,7 +236,12 @@ class ImageAssemblerFactory(ABC):
             if modules.ndim == 4:
                 # single module operation (for all 1M detectors and JungFrau)
                 if modules.shape[1] == 1:
-                    sm = modules.astype(_IMAGE_DTYPE).squeeze(axis=1)
+                    sm_shape = (modules.shape[0], *modules.shape[2:])
+                    if self._out_array is None or self._out_array.shape != sm_shape:
+                        self._out_array = np.empty(sm_shape, dtype=_IMAGE_DTYPE)
+                    sm = self._out_array
+                    # the data received from the bridge is read-only
+                    np.copyto(sm, modules.squeeze(axis=1))
                     if self._mask_asic:
                         maybe_mask_asic_edges(sm, self._detector)
                     return sm
@@ -201,9 +201,7 @@ class ImageProcessor(_BaseProcessor):
 
         image_data = data['processed'].image
         assembled = data['assembled']['data']
-        catalog = data['catalog']
-        det = catalog.main_detector
-        pulse_slicer = catalog.get_slicer(det)
+        pulse_slicer = data['catalog'].main_detector_item.slicer
 
         if self._recording_dark:
             self._record_dark(assembled)
@@ -290,7 +288,7 @@ class ImageProcessor(_BaseProcessor):
                     f"image mask!")
 
         if image_mask.shape != image_shape:
-            if np.sum(image_mask) == 0:
+            if not image_mask.any():
                 # reset the empty image mask automatically
                 image_mask = np.zeros(image_shape, dtype=np.bool)
             else:
@@ -7,6 +7,8 @@ Author: Jun Zhu <jun.zhu@xfel.eu>
 Copyright (C) European X-Ray Free-Electron Laser Facility GmbH.
 All rights reserved.
 """
+import numpy as np
+
 from .base_processor import _BaseProcessor
 from ..data_model import MovingAverageArray
 from ...database import Metadata as mt
@@ -44,6 +46,16 @@ class ImageTransformProcessor(_BaseProcessor):
         self._fft = _FourierTransform()
         self._ed = _EdgeDetection()
 
+        # buffer for the intermediate results of edge detection
+        self._scratch = None
+
+        # key: transform type, value: method which returns the
+        #      transformed image
+        self._process_impl = {
+            ImageTransformType.FOURIER_TRANSFORM: self._fourier_transform,
+            ImageTransformType.EDGE_DETECTION: self._edge_detect,
+        }
+
     def update(self):
         """Override."""
         cfg = self._meta.hget_all(mt.IMAGE_TRANSFORM_PROC)
@@ -63,22 +75,35 @@ class ImageTransformProcessor(_BaseProcessor):
 
     @profiler("Image transform processor")
     def process(self, data):
-        processed = data['processed']
-        image = processed.image
-
         transform_type = self._transform_type
+        if transform_type == ImageTransformType.UNDEFINED:
+            # ImageData.transform_type defaults to UNDEFINED
+            return
 
-        masked_mean = image.masked_mean
+        image = data['processed'].image
         image.transform_type = transform_type
 
-        if transform_type == ImageTransformType.FOURIER_TRANSFORM:
-            fft = self._fft
-            image.transformed = fourier_transform_2d(
-                masked_mean, logrithmic=fft.logrithmic)
-        elif transform_type == ImageTransformType.EDGE_DETECTION:
-            ed = self._ed
-            image.transformed = edge_detect(
-                masked_mean,
-                kernel_size=ed.kernel_size,
-                sigma=ed.sigma,
-                threshold=ed.threshold)
+        impl = self._process_impl.get(transform_type)
+        if impl is not None:
+            image.transformed = impl(image.masked_mean)
+
+    def _fourier_transform(self, masked_mean):
+        return fourier_transform_2d(
+            masked_mean, logrithmic=self._fft.logrithmic)
+
+    def _edge_detect(self, masked_mean):
+        ed = self._ed
+        scratch = self._scratch
+        if scratch is None \
+                or scratch.shape[1:] != masked_mean.shape \
+                or scratch.dtype != masked_mean.dtype:
+            scratch = np.zeros((2, *masked_mean.shape),
+                               dtype=masked_mean.dtype)
+            self._scratch = scratch
+
+        return edge_detect(
+            masked_mean,
+            kernel_size=ed.kernel_size,
+            sigma=ed.sigma,
+            threshold=ed.threshold,
+            scratch=scratch)
@@ -188,8 +188,11 @@ class PumpProbeProcessor(_BaseProcessor):
             if assembled.ndim == 3:
                 self._validate_on_off_indices(indices_on, indices_off)
 
-            indices_on = list(set(indices_on) - set(dropped_indices))
-            indices_off = list(set(indices_off) - set(dropped_indices))
+            if dropped_indices:
+                # keep the order of the on/off indices
+                dropped = set(dropped_indices)
+                indices_on = [i for i in indices_on if i not in dropped]
+                indices_off = [i for i in indices_off if i not in dropped]
 
             # on and off are not from different trains
             if mode in (PumpProbeMode.REFERENCE_AS_OFF,
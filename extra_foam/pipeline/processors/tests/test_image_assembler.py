@@ -954,6 +954,34 @@ class TestFastccdAssembler(unittest.TestCase):
             data['raw'][src] = np.ones((100, 100))
             self._assembler.process(data)
 
+    def testAssembledNotOverwrittenByNextTrain(self):
+        key_name = 'data.image'
+        src, catalog = self._create_catalog('SCS_CDIDET_FCCD2M/DAQ/FCCD:display', key_name)
+
+        def _get_data(tid, value):
+            return {
+                'catalog': catalog,
+                'meta': {
+                    src: {
+                        'train_id': tid,
+                        'source_type': DataSource.BRIDGE,
+                    }
+                },
+                'raw': {
+                    src: np.full((1934, 960, 1), value, dtype=_IMAGE_DTYPE)
+                },
+            }
+
+        data = _get_data(10001, 1)
+        self._assembler.process(data)
+        assembled = data['assembled']['data']
+
+        # the assembled image of a train is published (e.g. as the mean
+        # image of train-resolved detectors) and serialized in another
+        # thread, so it must not be modified when processing the next train
+        self._assembler.process(_get_data(10002, 2))
+        np.testing.assert_array_equal(np.ones((1934, 960)), assembled)
+
     def testAssembleBridgeCal(self):
         self._runAssembleBridgeTest((1934, 960, 1), _IMAGE_DTYPE, "data.image")
 
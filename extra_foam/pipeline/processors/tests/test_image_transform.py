@@ -74,5 +74,7 @@ class TestImageTransform(_TestDataMixin):
             mocked_f.assert_called_with(image.masked_mean,
                                         kernel_size=ed.kernel_size,
                                         sigma=ed.sigma,
-                                        threshold=ed.threshold)
+                                        threshold=ed.threshold,
+                                        scratch=self._proc._scratch)
             assert image.transform_type == ImageTransformType.EDGE_DETECTION
+            assert self._proc._scratch.shape == (2, 10, 10)
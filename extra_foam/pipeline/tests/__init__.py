@@ -65,6 +65,7 @@ class _TestDataMixin:
         src = f'{src_name} {key_name}'
         catalog.add_item(SourceItem(ctg, src_name, [], key_name, slicer, None, 1))
         catalog._main_detector = src
+        catalog._main_detector_item = catalog._items[src]
 
         n_pulses = processed.n_pulses
 
@@ -26,11 +26,8 @@ from .config import AnalysisType, config, PipelineSlowPolicy
 from .database import Metadata as mt
 from .ipc import init_redis_connection
 from .logger import logger
-from .gui import MainGUI, mkQApp
-from .pipeline import PulseWorker, TrainWorker
 from .processes import register_foam_process
 from .utils import check_system_resource, query_yes_no
-from .gui.windows import FileStreamWindow
 
 _CPU_INFO, _GPU_INFO, _MEMORY_INFO = check_system_resource()
 
@@ -254,6 +251,10 @@ def check_existing_redis_server(host, port, password):
 
 class Foam:
     def __init__(self, redis_address="127.0.0.1"):
+        # The GUI and the pipeline are imported here so that the command
+        # line tools which only talk to Redis do not load Qt.
+        from .gui import MainGUI
+        from .pipeline import PulseWorker, TrainWorker
 
         self._gui = None
 
@@ -367,6 +368,7 @@ def application():
         raise NotImplementedError("Connecting to remote Redis server is "
                                   "not supported yet!")
 
+    from .gui import mkQApp
     app = mkQApp()
     app.setStyleSheet(
         "QTabWidget::pane { border: 0; }"
@@ -443,6 +445,8 @@ def stream_file():
 
     args = parser.parse_args()
 
+    from .gui import mkQApp
+    from .gui.windows import FileStreamWindow
     app = mkQApp()
     streamer = FileStreamWindow(port=args.port)
     app.exec_()
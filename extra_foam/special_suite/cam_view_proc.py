@@ -9,6 +9,8 @@ All rights reserved.
 """
 import numpy as np
 
+from extra_data import by_index
+
 from extra_foam.algorithms import hist_with_stats
 from extra_foam.pipeline.data_model import MovingAverageArray
 
@@ -17,6 +19,8 @@ from .special_analysis_base import profiler, QThreadWorker
 
 _DEFAULT_N_BINS = 10
 _DEFAULT_BIN_RANGE = "-inf, inf"
+# number of trains loaded at once when averaging a dark run
+_DARK_CHUNK_SIZE = 64
 
 
 class CamViewProcessor(QThreadWorker):
@@ -73,16 +77,33 @@ class CamViewProcessor(QThreadWorker):
         run = self._loadRunDirectoryST(dirpath)
         if run is not None:
             try:
-                arr = run.get_array(self._output_channel, self._ppt)
-                shape = arr.shape
-                if arr.ndim != 3:
-                    self.log.error(f"Data must be a 3D array! "
-                                   f"Actual shape: {shape}")
+                # load the data chunk by chunk to avoid loading the whole
+                # run into memory
+                acc = None
+                n_frames = 0
+                n_trains = len(run.train_ids)
+                for i in range(0, n_trains, _DARK_CHUNK_SIZE):
+                    arr = run.select_trains(
+                        by_index[i:i + _DARK_CHUNK_SIZE]).get_array(
+                        self._output_channel, self._ppt)
+                    if arr.ndim != 3:
+                        self.log.error(f"Data must be a 3D array! "
+                                       f"Actual shape: {arr.shape}")
+                        return
+
+                    if acc is None:
+                        acc = np.zeros(arr.shape[1:], dtype=np.float64)
+                    acc += arr.values.sum(axis=0, dtype=np.float64)
+                    n_frames += arr.shape[0]
+
+                if not n_frames:
+                    self.log.error("No dark data found!")
                     return
 
-                self.log.info(f"Found dark data with shape {shape}")
-                # FIXME: performance
-                self._dark_ma = np.mean(arr.values, axis=0, dtype=_IMAGE_DTYPE)
+                self.log.info(f"Found dark data with shape "
+                              f"{(n_frames, *acc.shape)}")
+                acc /= n_frames
+                self._dark_ma = acc.astype(_IMAGE_DTYPE)
             except Exception as e:
                 self.log.error(f"Unexpect exception when getting data array: "
                                f"{repr(e)}")
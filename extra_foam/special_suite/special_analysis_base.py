@@ -507,6 +507,8 @@ class QThreadWorker(QObject):
         else:
             img = arr
 
+        # caveat: the input array is returned without copying if it
+        #         already has the required dtype
         if img.dtype != _IMAGE_DTYPE:
             img = img.astype(_IMAGE_DTYPE)
 
@@ -153,17 +153,26 @@ class TestCamViewProcessor(_RawDataMixin, _SpecialSuiteProcessorTestBase):
         load_run.return_value = data_collection
         with patch.object(proc.log, "error") as error:
             # get_array returns a wrong shape
-            data_collection.get_array.return_value = DataArray(np.random.randn(4, 3))
+            data_collection.train_ids = list(range(4))
+            data_collection.select_trains.return_value.get_array.return_value = \
+                DataArray(np.random.randn(4, 3))
             proc.onLoadDarkRun("run/path")
             error.assert_called_once()
             error.reset_mock()
+            data_collection.select_trains.reset_mock()
 
             # get_array returns a correct shape
-            data_collection.get_array.return_value = DataArray(np.random.randn(4, 3, 2))
+            dark = np.random.randn(100, 3, 2)
+            data_collection.train_ids = list(range(100))
+            chunks = [DataArray(dark[i:i + 64]) for i in range(0, 100, 64)]
+            data_collection.select_trains.return_value.get_array.side_effect = \
+                chunks
             with patch.object(proc.log, "info") as info:
                 proc.onLoadDarkRun("run/path")
                 info.assert_called_once()
                 error.assert_not_called()
+            np.testing.assert_array_almost_equal(dark.mean(axis=0), proc._dark_ma)
+            assert 2 == data_collection.select_trains.call_count
 
     def testProcessingWhenRecordingDark(self):
         from extra_foam.special_suite.cam_view_proc import _IMAGE_DTYPE
@@ -235,6 +244,20 @@ class TestCamViewProcessor(_RawDataMixin, _SpecialSuiteProcessorTestBase):
         proc.reset()
         assert proc._raw_ma is None
 
+    def testDarkSubtractedImageNotOverwritten(self):
+        from extra_foam.special_suite.cam_view_proc import _IMAGE_DTYPE
+
+        proc = self._proc
+        proc._recording_dark_st = False
+        proc._subtract_dark_st = True
+        proc._dark_ma = np.ones_like(self._img_data).astype(_IMAGE_DTYPE)
+
+        displayed = proc.process(self._get_data(12345))["displayed"]
+        displayed_gt = displayed.copy()
+        # the image sent to the GUI must not be modified by the next train
+        proc.process(self._get_data(12346, 2))
+        np.testing.assert_array_equal(displayed_gt, displayed)
+
     def _check_processed_data_structure(self, ret):
         """Override."""
         data_gt = TestCamViewWindow.data4visualization().keys()
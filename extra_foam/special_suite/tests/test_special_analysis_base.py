@@ -329,6 +329,12 @@ class testSpecialAnalysisBase(_RawDataMixin, unittest.TestCase):
         assert np.float32 == ret_3d.dtype
         assert func(a3d_f) is None
 
+        # no copy if the dtype already matches
+        a2d_f32 = np.ones((2, 2), dtype=np.float32)
+        assert func(a2d_f32) is a2d_f32
+        a3d_f32 = np.ones((1, 3, 3), dtype=np.float32)
+        assert np.shares_memory(a3d_f32, func(a3d_f32))
+
     def testGetRoiData(self):
         worker = self._win._worker_st
 
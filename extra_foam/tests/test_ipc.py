@@ -1,15 +1,17 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import time
 
+import numpy as np
 from redis.client import PubSub, Redis
 
 from extra_foam.logger import logger
 from extra_foam.services import start_redis_server
 from extra_foam.ipc import (
     init_redis_connection, redis_connection, RedisConnection, RedisSubscriber,
-    RedisPSubscriber, _global_connections
+    RedisPSubscriber, _global_connections, ImageMaskSub
 )
+from extra_foam.serialization import serialize_image
 from extra_foam.pipeline.f_worker import ProcessWorker
 from extra_foam.processes import wait_until_redis_shutdown
 
@@ -150,3 +152,45 @@ class TestRedisConnection(unittest.TestCase):
         self.assertIsNone(_global_connections['RedisSubscriber'][0]()._sub)
         self.assertIsNone(_global_connections['RedisPSubscriber'][0]()._sub)
         self.assertIsNone(_global_connections['RedisPSubscriber'][0]()._sub)
+
+
+class TestImageMaskSub(unittest.TestCase):
+    def _update(self, mask, shape, msgs):
+        sub = MagicMock()
+        sub.get_message.side_effect = [
+            {'channel': f'image_mask:{topic}'.encode(), 'data': data}
+            for topic, data in msgs] + [None]
+        with patch.object(ImageMaskSub, "_sub", sub):
+            return ImageMaskSub().update(mask, shape)
+
+    def testUpdate(self):
+        mask = np.zeros((4, 4), dtype=np.bool)
+
+        updated, ret = self._update(mask, (4, 4), [])
+        self.assertFalse(updated)
+        self.assertIs(mask, ret)
+
+        # draw/erase before 'set' are superseded
+        new_mask = np.zeros((2, 3), dtype=np.bool)
+        new_mask[0, 0] = True
+        updated, ret = self._update(mask, (4, 4), [
+            ('draw', b'(0, 0, 4, 4)'),
+            ('set', serialize_image(new_mask, is_mask=True)),
+            ('draw', b'(2, 1, 1, 1)'),
+        ])
+        self.assertTrue(updated)
+        new_mask[1, 2] = True
+        np.testing.assert_array_equal(new_mask, ret)
+        self.assertFalse(mask.any())
+
+    def testSetThenRemove(self):
+        mask = np.ones((4, 4), dtype=np.bool)
+        new_mask = np.ones((2, 3), dtype=np.bool)
+        updated, ret = self._update(mask, (4, 4), [
+            ('set', serialize_image(new_mask, is_mask=True)),
+            ('remove', b''),
+        ])
+        self.assertTrue(updated)
+        # 'remove' clears the mask that was set, not the one passed in
+        np.testing.assert_array_equal(np.zeros((2, 3), dtype=np.bool), ret)
+        self.assertTrue(mask.all())
@@ -9,6 +9,10 @@ All rights reserved.
 """
 import sys
 import argparse
+import functools
+import time
+
+import numpy as np
 
 import dash
 import dash_core_components as dcc
@@ -47,6 +51,54 @@ app.config['suppress_callback_exceptions'] = True
 meta_proxy = MetaProxy()
 mon_proxy = MonProxy()
 
+# static layout of the performance plot
+_PERFORMANCE_LAYOUT = {
+    'xaxis': {
+        'title': 'Train ID',
+    },
+    'yaxis': {
+        'title': 'Processing rate (Hz)',
+    },
+    'font': {
+        'family': 'Courier New, monospace',
+        'size': 16,
+        'color': Color.INFO,
+    },
+    'margin': {
+        'l': 100, 'b': 50, 't': 50, 'r': 50,
+    },
+    'paper_bgcolor': Color.SHADE,
+    'plot_bgcolor': Color.SHADE,
+}
+
+
+def _ttl_cache(ttl):
+    """Cache the result of a Redis query for 'ttl' seconds.
+
+    Every opened page polls with its own interval. Caching the queries
+    lets all of them share a single Redis round-trip per update.
+
+    :param float ttl: time to live of a cached result in seconds.
+    """
+    def decorator(func):
+        cache = dict()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            try:
+                timestamp, ret = cache[args]
+                if now - timestamp < ttl:
+                    return ret
+            except KeyError:
+                pass
+
+            ret = func(*args)
+            cache[args] = (now, ret)
+            return ret
+        return wrapper
+    return decorator
+
 
 def get_top_bar_cell(name, value):
     """Get cell for the top bar.
@@ -73,6 +125,7 @@ def get_top_bar():
     ]
 
 
+@_ttl_cache(0.5 * FAST_UPDATE)
 def get_analysis_types():
     """Query and parse analysis types."""
     ret = []
@@ -84,6 +137,7 @@ def get_analysis_types():
     return ret
 
 
+@_ttl_cache(0.5 * FAST_UPDATE)
 def get_processor_params(proc=None):
     """Query and parse processor metadata."""
     if proc is None:
@@ -94,83 +148,83 @@ def get_processor_params(proc=None):
     return [{'param': k, 'value': v} for k, v in query.items()]
 
 
-# define callback functions
-
-@app.callback(output=[Output('Detector', 'children'),
-                      Output('Topic', 'children'),
-                      Output('Train ID', 'children')],
-              inputs=[Input('fast_interval1', 'n_intervals')])
-def update_top_bar(n_intervals):
-    ret = mon_proxy.get_last_tid()
+@_ttl_cache(0.5 * FAST_UPDATE)
+def get_session_info():
+    """Query the detector, topic and the latest train ID."""
+    ret = mon_proxy.get_last_tid_and_session()
+    if ret is None:
+        # connection failed
+        last, sess = None, None
+    else:
+        last, sess = ret
 
-    if not ret:
-        # [] or None
+    if not last:
         tid = '0' * 9
     else:
-        _, tid = ret
+        _, tid = last
 
-    sess = meta_proxy.hget_all(Metadata.SESSION)
     detector = "Unknown" if sess is None else sess['detector']
     topic = "Unknown" if sess is None else sess['topic']
 
     return detector, topic, tid
 
 
+@_ttl_cache(0.5 * SLOW_UPDATE)
+def get_latest_tids():
+    """Query the timestamps and IDs of the latest processed trains."""
+    return mon_proxy.get_latest_tids()
+
+
+# define callback functions
+
+@app.callback(output=[Output('Detector', 'children'),
+                      Output('Topic', 'children'),
+                      Output('Train ID', 'children')],
+              inputs=[Input('fast_interval1', 'n_intervals')])
+def update_top_bar(n_intervals):
+    return get_session_info()
+
+
 @app.callback(output=Output('analysis_type_table', 'data'),
-              inputs=[Input('fast_interval2', 'n_intervals')])
-def update_analysis_types(n_intervals):
-    return get_analysis_types()
+              inputs=[Input('fast_interval2', 'n_intervals')],
+              state=[State('analysis_type_table', 'data')])
+def update_analysis_types(n_intervals, prev):
+    ret = get_analysis_types()
+    if ret == prev:
+        # 'prev' is the data currently shown on this page
+        raise dash.exceptions.PreventUpdate()
+    return ret
 
 
 @app.callback(output=Output('processor_params_table', 'data'),
               inputs=[Input('fast_interval3', 'n_intervals')],
-              state=[State('processor_dropdown', 'value')])
-def update_processor_params(n_intervals, proc):
-    return get_processor_params(proc)
+              state=[State('processor_dropdown', 'value'),
+                     State('processor_params_table', 'data')])
+def update_processor_params(n_intervals, proc, prev):
+    ret = get_processor_params(proc)
+    if ret == prev:
+        raise dash.exceptions.PreventUpdate()
+    return ret
 
 
 @app.callback(output=Output('performance', 'figure'),
               inputs=[Input('slow_interval', 'n_intervals')])
 def update_performance(n_intervals):
-    ret = mon_proxy.get_latest_tids()
+    ret = get_latest_tids()
     if ret is None:
         raise dash.exceptions.PreventUpdate()
 
-    tids = []
-    freqs = []
-    prev_timestamp = None
-    for timestamp, tid in ret:
-        tids.append(tid)
-        float_timestamp = float(timestamp)
-        if not freqs:
-            freqs.append(0)
-        else:
-            freqs.append(1. / (prev_timestamp - float_timestamp))
-
-        prev_timestamp = float_timestamp
+    tids = [tid for _, tid in ret]
+    timestamps = np.array([ts for ts, _ in ret], dtype=np.float64)
+    freqs = np.zeros_like(timestamps)
+    # timestamps are in descending order
+    np.reciprocal(-np.diff(timestamps), out=freqs[1:])
 
-    traces = [go.Bar(x=tids, y=freqs,
+    traces = [go.Bar(x=tids, y=freqs.tolist(),
                      marker=dict(color=Color.GRAPH))]
     figure = {
         'data': traces,
-        'layout': {
-            'xaxis': {
-                'title': 'Train ID',
-            },
-            'yaxis': {
-                'title': 'Processing rate (Hz)',
-            },
-            'font': {
-                'family': 'Courier New, monospace',
-                'size': 16,
-                'color': Color.INFO,
-            },
-            'margin': {
-                'l': 100, 'b': 50, 't': 50, 'r': 50,
-            },
-            'paper_bgcolor': Color.SHADE,
-            'plot_bgcolor': Color.SHADE,
-        }
+        'layout': _PERFORMANCE_LAYOUT,
     }
 
     return figure
@@ -21,24 +21,38 @@ from setuptools import setup, Command, find_packages, Distribution, Extension
 from setuptools.command.build_ext import build_ext
 from setuptools.command.test import test as _TestCommand
 from distutils.command.clean import clean
-from distutils.version import LooseVersion
-from distutils.util import strtobool
 
 
 with open(osp.join(osp.abspath(osp.dirname(__file__)), 'README.md')) as f:
     long_description = f.read()
 
 
+# the second alternative could be a hotfix, e.g. "1.0.0.1"
+_VERSION_RE = re.compile(
+    r'^__version__ = "(\d+\.\d+\.\d[a-z]*\d*|(?:\d+\.){3}\d+)"', re.M)
+
+
 def find_version():
     with open(osp.join('extra_foam', '__init__.py')) as fp:
-        for line in fp:
-            m = re.search(r'^__version__ = "(\d+\.\d+\.\d[a-z]*\d*)"', line, re.M)
-            if m is None:
-                # could be a hotfix
-                m = re.search(r'^__version__ = "(\d.){3}\d"', line, re.M)
-            if m is not None:
-                return m.group(1)
+        m = _VERSION_RE.search(fp.read())
+    if m is None:
         raise RuntimeError("Unable to find version string.")
+    return m.group(1)
+
+
+def strtobool(v):
+    """Convert a string representation of truth to True or False."""
+    v = v.lower()
+    if v in ('y', 'yes', 't', 'true', 'on', '1'):
+        return True
+    if v in ('n', 'no', 'f', 'false', 'off', '0'):
+        return False
+    raise ValueError(f"Invalid truth value: {v}")
+
+
+def version_tuple(v):
+    """Convert a version string like '3.13.0' into a tuple of integers."""
+    return tuple(int(x) for x in v.split('.') if x)
 
 
 @contextlib.contextmanager
@@ -105,10 +119,10 @@ class BuildExt(build_ext):
                                "following extensions: " + ", ".join(
                 e.name for e in self.extensions))
 
-        cmake_version = LooseVersion(
-            re.search(r'version\s*([\d.]+)', out.decode()).group(1))
+        cmake_version = re.search(r'version\s*([\d.]+)', out.decode()).group(1)
         cmake_minimum_version_required = '3.13.0'
-        if cmake_version < cmake_minimum_version_required:
+        if version_tuple(cmake_version) < \
+                version_tuple(cmake_minimum_version_required):
             raise RuntimeError(f"CMake >= {cmake_minimum_version_required} "
                                f"is required!")
 
@@ -151,8 +165,12 @@ class BuildExt(build_ext):
         cmake_options.append(
             f'-DBUILD_FOAM_TESTS={_opt_switch(self.with_tests)}')
 
+        if shutil.which('ccache') is not None:
+            cmake_options.append('-DCMAKE_CXX_COMPILER_LAUNCHER=ccache')
+
         max_jobs = os.environ.get('BUILD_FOAM_MAX_JOBS', str(mp.cpu_count()))
-        build_options = ['--', '-j', max_jobs]
+        # '--parallel' is independent of the generator (CMake >= 3.12)
+        build_options = ['--parallel', max_jobs]
 
         if not os.path.exists(self.build_temp):
             os.makedirs(self.build_temp)
@@ -189,7 +207,8 @@ class BuildExt(build_ext):
             if not os.path.exists(parent_directory):
                 os.makedirs(parent_directory)
 
-            if not os.path.exists(dst):
+            if not os.path.exists(dst) or \
+                    os.path.getmtime(src) > os.path.getmtime(dst):
                 self.announce(f"copy {src} to {dst}", level=1)
                 shutil.copy(src, dst)
 
@@ -220,13 +239,18 @@ class TestCommand(_TestCommand):
 
     def run(self):
         # build and run cpp test
-        build_temp = osp.join('build', self._get_build_dir('temp'))
-        with changed_cwd(build_temp):
-            self.spawn(['make', 'ftest'])
+        if not strtobool(os.environ.get('FOAM_SKIP_CPP_TESTS', '0')):
+            build_temp = osp.join('build', self._get_build_dir('temp'))
+            with changed_cwd(build_temp):
+                self.spawn(['cmake', '--build', '.', '--target', 'ftest'])
 
         # run Python test
         import pytest
-        errno = pytest.main(['extra_foam'])
+        argv = ['extra_foam']
+        if os.environ.get('CI'):
+            # the cache is thrown away together with the CI machine
+            argv += ['-p', 'no:cacheprovider']
+        errno = pytest.main(argv)
         sys.exit(errno)
 
 
@@ -295,11 +319,11 @@ setup(
         ]
     },
     install_requires=[
-        'numpy>=1.16.1',
-        'scipy>=1.2.1',
-        'msgpack>=0.5.6',
+        'numpy>=1.16.1,<2',
+        'scipy>=1.2.1,<2',
+        'msgpack>=1.0.0',
         'msgpack-numpy>=0.4.4',
-        'pyzmq>=17.1.2',
+        'pyzmq>=17.1.2,<26',
         'pyFAI>=0.17.0',
         'PyQt5==5.13.2',
         'EXtra-data>=1.0.0',
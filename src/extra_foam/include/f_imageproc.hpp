@@ -11,6 +11,7 @@
 #define EXTRA_FOAM_IMAGE_PROC_H
 
 #include <type_traits>
+#include <vector>
 
 #include "xtensor/xview.hpp"
 #include "xtensor/xmath.hpp"
@@ -44,39 +45,52 @@ inline auto nanmeanImageArrayImp(E&& src, const std::vector<size_t>& keep = {})
   tbb::parallel_for(tbb::blocked_range2d<int>(0, shape[1], 0, shape[2]),
     [&src, &keep, &shape, &mean] (const tbb::blocked_range2d<int> &block)
     {
-      for(int j=block.rows().begin(); j != block.rows().end(); ++j)
+      int j0 = block.rows().begin();
+      int j1 = block.rows().end();
+      int k0 = block.cols().begin();
+      int k1 = block.cols().end();
+      std::size_t n_cols = k1 - k0;
+
+      // Sweep the images over the block one by one so that the reads are
+      // contiguous along x, while the partial sums of the block stay in
+      // cache. The summation order of each pixel is unchanged.
+      std::vector<value_type> sums((j1 - j0) * n_cols, value_type(0));
+      std::vector<std::size_t> counts((j1 - j0) * n_cols, 0);
+
+      auto accumulate = [&src, &sums, &counts, j0, j1, k0, k1, n_cols] (std::size_t i)
       {
-        for(int k=block.cols().begin(); k != block.cols().end(); ++k)
+        for (int j=j0; j != j1; ++j)
         {
-          std::size_t count = 0;
-          value_type sum = 0;
-          if (keep.empty())
-          {
-            for (size_t i=0; i<shape[0]; ++i)
-            {
-              auto v = src(i, j, k);
-              if (! std::isnan(v))
-              {
-                count += 1;
-                sum += v;
-              }
-            }
-          } else
+          std::size_t offset = (j - j0) * n_cols;
+          for (int k=k0; k != k1; ++k)
           {
-            for (auto it=keep.begin(); it != keep.end(); ++it)
+            auto v = src(i, j, k);
+            if (! std::isnan(v))
             {
-              auto v = src(*it, j, k);
-              if (! std::isnan(v))
-              {
-                count += 1;
-                sum += v;
-              }
+              counts[offset + k - k0] += 1;
+              sums[offset + k - k0] += v;
             }
           }
+        }
+      };
 
+      if (keep.empty())
+      {
+        for (size_t i=0; i<shape[0]; ++i) accumulate(i);
+      } else
+      {
+        for (auto it=keep.begin(); it != keep.end(); ++it) accumulate(*it);
+      }
+
+      for (int j=j0; j != j1; ++j)
+      {
+        std::size_t offset = (j - j0) * n_cols;
+        for (int k=k0; k != k1; ++k)
+        {
+          std::size_t count = counts[offset + k - k0];
           if (count == 0)
             mean(j, k) = std::numeric_limits<value_type>::quiet_NaN();
-          else mean(j, k) = sum / value_type(count);
+          else mean(j, k) = sums[offset + k - k0] / value_type(count);
         }
       }
     }